@@ -0,0 +1,179 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import pygame.display
+import pygame.image
+from pygame import SRCALPHA, Surface
+
+from .images import SpriteSheetDataStruct, SpriteSheetList, SpriteSheetMap
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class AssetLoader:
+    """Decodes image files on a thread pool and builds sprite sheets from them.
+    Call poll() once per frame from the main thread, which converts finished images to the
+    display format and builds their sheets, so a loading screen can keep rendering.
+    Images finished before a display exists are converted once one does
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        on_progress: ProgressCallback | None = None,
+    ):
+        """Creates new instance of AssetLoader object
+
+        Args:
+            max_workers (int | None, optional): Decoding threads. Defaults to None (ThreadPoolExecutor default).
+            on_progress (ProgressCallback | None, optional): Called from poll() with (loaded, total) when an asset finishes. Defaults to None.
+        """
+        self.max_workers = max_workers
+        self.on_progress = on_progress
+        self.assets: dict[str, SpriteSheetDataStruct] = {}
+        self.errors: dict[str, Exception] = {}
+        self._requests: dict[str, tuple[str, type[SpriteSheetDataStruct], dict]] = {}
+        self._pending: dict[str, Future[Surface]] = {}
+        # built before a display existed, so not yet in the display format
+        self._unconverted: list[str] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def total(self) -> int:
+        """Number of requested assets"""
+        return len(self._requests)
+
+    @property
+    def loaded(self) -> int:
+        """Number of assets built or failed"""
+        return len(self.assets) + len(self.errors)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of requested assets finished, from 0.0 to 1.0"""
+        return min(self.loaded / self.total, 1.0) if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        """True when every requested asset is built or failed"""
+        return self.loaded == self.total
+
+    def add_list(self, name: str, path: str, **kwargs: Any):
+        """Requests a SpriteSheetList
+
+        Args:
+            name (str): Key of the built sheet in assets
+            path (str): The image file
+            **kwargs: Passed to SpriteSheetList, e.g. n_sprites
+        """
+        self._add(name, path, SpriteSheetList, kwargs)
+
+    def add_map(self, name: str, path: str, **kwargs: Any):
+        """Requests a SpriteSheetMap
+
+        Args:
+            name (str): Key of the built sheet in assets
+            path (str): The image file
+            **kwargs: Passed to SpriteSheetMap, e.g. keys, n_sprites
+        """
+        self._add(name, path, SpriteSheetMap, kwargs)
+
+    def start(self):
+        """Starts decoding every requested image that isn't already started, built or failed"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers)
+
+        for name, (path, _, _) in self._requests.items():
+            if (
+                name not in self._pending
+                and name not in self.assets
+                and name not in self.errors
+            ):
+                self._pending[name] = self._executor.submit(pygame.image.load, path)
+
+    def poll(self) -> float:
+        """Builds sheets for every decoded image, and converts earlier ones once a display
+        exists. Call from the main thread
+
+        Returns:
+            float: progress
+        """
+        for name in [n for n, f in self._pending.items() if f.done()]:
+            future = self._pending.pop(name)
+            _, sheet_type, kwargs = self._requests[name]
+            try:
+                self.assets[name] = sheet_type(self._convert(future.result()), **kwargs)
+            except Exception as e:
+                self.errors[name] = e
+            else:
+                if pygame.display.get_surface() is None:
+                    self._unconverted.append(name)
+
+            if self.on_progress is not None:
+                self.on_progress(self.loaded, self.total)
+
+        self.convert_all()
+        if self.done:
+            self.shutdown()
+
+        return self.progress
+
+    def wait(self) -> dict[str, SpriteSheetDataStruct]:
+        """Starts loading if needed and blocks until every asset is finished
+
+        Returns:
+            dict[str, SpriteSheetDataStruct]: assets
+        """
+        self.start()
+        for future in list(self._pending.values()):
+            future.exception()
+        self.poll()
+
+        return self.assets
+
+    def convert_all(self):
+        """Converts sheets built before a display existed to the display format. Called by
+        poll(). Call after pygame.display.set_mode() if poll() is no longer called
+        """
+        if not self._unconverted or pygame.display.get_surface() is None:
+            return
+
+        for name in self._unconverted:
+            sheet = self.assets[name]
+            sheet.spritesheet = self._convert(sheet.spritesheet)
+            # cached segments were cut from the unconverted image
+            sheet.clear_cache()
+            if self._requests[name][2].get("preload"):
+                sheet.preload()
+        self._unconverted.clear()
+
+    def shutdown(self):
+        """Stops the thread pool. Unstarted images are not loaded"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _add(
+        self,
+        name: str,
+        path: str,
+        sheet_type: type[SpriteSheetDataStruct],
+        kwargs: dict,
+    ):
+        if name in self._requests:
+            msg = f"Asset {name} already requested"
+            raise KeyError(msg)
+
+        self._requests[name] = (path, sheet_type, kwargs)
+
+    @staticmethod
+    def _convert(image: Surface) -> Surface:
+        # converting needs a display, and must happen on the main thread
+        if pygame.display.get_surface() is None:
+            return image
+
+        if image.get_flags() & SRCALPHA:
+            return image.convert_alpha()
+
+        return image.convert()
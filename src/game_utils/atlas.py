@@ -0,0 +1,234 @@
+import json
+import os
+
+import pygame.display
+import pygame.image
+from pygame import SRCALPHA, Rect, Surface
+
+from .images import SpriteSheetDataStruct, SpriteSheetMap
+
+
+class TextureAtlas:
+    """Named images packed into one or a few large surfaces (pages).
+    Lookups behave like a SpriteSheetMap over every page
+    """
+
+    def __init__(self, pages: list[Surface], rects: dict[str, tuple[int, Rect]]):
+        """Creates new instance of TextureAtlas object. Use AtlasBuilder.build or TextureAtlas.load
+
+        Args:
+            pages (list[Surface]): The packed surfaces
+            rects (dict[str, tuple[int, Rect]]): Page index and rect of every image, by name
+        """
+        self.rects = rects
+        self.pages: list[SpriteSheetMap] = []
+        for i, page in enumerate(pages):
+            names = [name for name, (p, _) in rects.items() if p == i]
+            self.pages.append(
+                SpriteSheetMap(
+                    page,
+                    keys=names,
+                    n_sprites=len(names),
+                    subsurface=True,
+                    sprite_rects=[rects[name][1] for name in names],
+                )
+            )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.rects
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def get(self, name: str) -> Surface | None:
+        entry = self.rects.get(name)
+
+        if entry is not None:
+            return self.pages[entry[0]][name]
+
+    def __getitem__(self, name: str) -> Surface:
+        entry = self.rects.get(name)
+
+        if entry is None:
+            msg = f"No key {name}"
+            raise KeyError(msg)
+
+        return self.pages[entry[0]][name]
+
+    def sprite_map(self, name: str) -> SpriteSheetMap:
+        """A SpriteSheetMap of the images added under name with AtlasBuilder.add_sheet
+
+        Args:
+            name (str): The name given to add_sheet
+
+        Raises:
+            KeyError: No images were added under name
+            ValueError: The images were packed onto more than one page
+
+        Returns:
+            SpriteSheetMap: Keyed by the sheet's own keys, sharing pixels with the atlas
+        """
+        prefix = f"{name}/"
+        entries = {
+            key[len(prefix) :]: entry
+            for key, entry in self.rects.items()
+            if key.startswith(prefix)
+        }
+
+        if not entries:
+            msg = f"No sheet {name}"
+            raise KeyError(msg)
+
+        pages = {page for page, _ in entries.values()}
+        if len(pages) > 1:
+            msg = f"Sheet {name} spans {len(pages)} atlas pages"
+            raise ValueError(msg)
+
+        keys = list(entries)
+        return SpriteSheetMap(
+            self.pages[pages.pop()].spritesheet,
+            keys=keys,
+            n_sprites=len(keys),
+            subsurface=True,
+            sprite_rects=[entries[key][1] for key in keys],
+        )
+
+    def save(self, path: str):
+        """Saves every page as a png next to path, and the rect table to path as json
+
+        Args:
+            path (str): The json file to write, e.g. "atlas.json"
+        """
+        base, _ = os.path.splitext(path)
+        page_files = []
+        for i, page in enumerate(self.pages):
+            page_file = f"{base}_{i}.png"
+            pygame.image.save(page.spritesheet, page_file)
+            page_files.append(os.path.basename(page_file))
+
+        table = {
+            "pages": page_files,
+            "rects": {name: [page, *rect] for name, (page, rect) in self.rects.items()},
+        }
+        with open(path, "w") as f:
+            json.dump(table, f)
+
+    @classmethod
+    def load(cls, path: str) -> "TextureAtlas":
+        """Loads an atlas written by TextureAtlas.save. Pages are converted
+        to the display format if a display exists
+
+        Args:
+            path (str): The json file written by save
+
+        Returns:
+            TextureAtlas: The loaded atlas
+        """
+        with open(path) as f:
+            table = json.load(f)
+
+        directory = os.path.dirname(path)
+        pages = []
+        for page_file in table["pages"]:
+            page = pygame.image.load(os.path.join(directory, page_file))
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            pages.append(page)
+
+        rects = {
+            name: (page, Rect(x, y, w, h))
+            for name, (page, x, y, w, h) in table["rects"].items()
+        }
+        return cls(pages, rects)
+
+
+class AtlasBuilder:
+    """Packs images and sprite sheets into a TextureAtlas using shelf packing.
+    Images are sorted by height and laid left to right in rows, starting a new page when one fills up
+    """
+
+    def __init__(self, max_size: tuple[int, int] = (2048, 2048), padding: int = 1):
+        """Creates new instance of AtlasBuilder object
+
+        Args:
+            max_size (tuple[int, int], optional): Largest page size. Defaults to (2048, 2048).
+            padding (int, optional): Empty pixels between images, prevents bleeding when scaled. Defaults to 1.
+        """
+        self.max_size = max_size
+        self.padding = padding
+        self.images: dict[str, Surface] = {}
+
+    def add_image(self, name: str, image: Surface):
+        """Adds a single image
+
+        Args:
+            name (str): Unique name of the image in the atlas
+            image (Surface): The image
+        """
+        w, h = image.get_size()
+        if w > self.max_size[0] or h > self.max_size[1]:
+            msg = f"Image {name} is larger than max_size {self.max_size}"
+            raise ValueError(msg)
+
+        self.images[name] = image
+
+    def add_sheet(self, name: str, sheet: SpriteSheetDataStruct):
+        """Adds every sprite of sheet, named "<name>/<key>". Keys are a SpriteSheetMap's
+        keys or a SpriteSheetList's indexes
+
+        Args:
+            name (str): The sheet name, used with TextureAtlas.sprite_map
+            sheet (SpriteSheetDataStruct): The sheet to add
+        """
+        if isinstance(sheet, SpriteSheetMap):
+            sprites = sheet.sprite_map.items()
+        else:
+            sprites = enumerate(sheet.sprite_rects)
+
+        for key, rect in sprites:
+            self.add_image(f"{name}/{key}", sheet.get_spritesheet_segment(rect))
+
+    def build(self) -> TextureAtlas:
+        """Packs every added image
+
+        Returns:
+            TextureAtlas: The packed atlas
+        """
+        max_w, max_h = self.max_size
+        pad = self.padding
+        order = sorted(
+            self.images, key=lambda name: self.images[name].get_height(), reverse=True
+        )
+
+        rects: dict[str, tuple[int, Rect]] = {}
+        page_sizes: list[tuple[int, int]] = []
+        page = 0
+        x = y = shelf_h = used_w = 0
+        for name in order:
+            w, h = self.images[name].get_size()
+
+            if x + w > max_w:
+                # next shelf
+                x = 0
+                y += shelf_h + pad
+                shelf_h = 0
+
+            if y + h > max_h:
+                # next page
+                page_sizes.append((used_w, y - pad))
+                page += 1
+                x = y = shelf_h = used_w = 0
+
+            rects[name] = (page, Rect(x, y, w, h))
+            x += w + pad
+            shelf_h = max(shelf_h, h)
+            used_w = max(used_w, x - pad)
+
+        if rects:
+            page_sizes.append((used_w, y + shelf_h))
+
+        pages = [Surface(size, SRCALPHA) for size in page_sizes]
+        for name, (i, rect) in rects.items():
+            pages[i].blit(self.images[name], rect)
+
+        return TextureAtlas(pages, rects)
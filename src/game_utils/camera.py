@@ -0,0 +1,178 @@
+from collections.abc import Iterable
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from pygame import Rect, Vector2
+from pygame.sprite import Sprite
+
+from .spatial import SpatialGroup
+
+
+class Camera:
+    """A viewport onto a world larger than the screen. Converts world coordinates to
+    screen coordinates, culls sprites outside the view and updates sprites far from
+    the view less often. Set as ScreenSettings.camera to draw through it
+    """
+
+    def __init__(
+        self,
+        width: float,
+        height: float,
+        position: Vector2 | None = None,
+        world_bounds: Rect | None = None,
+        far_margin: float = 0.0,
+        far_interval: int = 4,
+    ):
+        """Creates new instance of Camera object
+
+        Args:
+            width (float): Width of the view, usually the screen width
+            height (float): Height of the view, usually the screen height
+            position (Vector2 | None, optional): World position at the center of the view. (width / 2, height / 2) if None. Defaults to None.
+            world_bounds (Rect | None, optional): Area the view is kept inside, in world coordinates. Unbounded if None. Defaults to None.
+            far_margin (float, optional): Distance around the view within which sprites still update every frame. Defaults to 0.0.
+            far_interval (int, optional): Sprites beyond far_margin update once every far_interval frames. Defaults to 4.
+        """
+        if far_interval < 1:
+            raise ValueError("far_interval must be at least 1")
+
+        self.width = width
+        self.height = height
+        self.world_bounds = world_bounds
+        self.far_margin = far_margin
+        self.far_interval = far_interval
+        self.position = Vector2(width / 2, height / 2)
+        self.frame = 0
+        self._elapsed: WeakKeyDictionary[Sprite, float] = WeakKeyDictionary()
+        self._phases: WeakKeyDictionary[Sprite, int] = WeakKeyDictionary()
+
+        if position is not None:
+            self.move_to(position)
+
+    @property
+    def offset(self) -> Vector2:
+        """World position of the top left of the view"""
+        return self.position - Vector2(self.width / 2, self.height / 2)
+
+    @property
+    def rect(self) -> Rect:
+        """The view in world coordinates"""
+        x, y = self.offset
+        return Rect(int(x), int(y), self.width, self.height)
+
+    @property
+    def near_rect(self) -> Rect:
+        """The view grown by far_margin. Sprites outside it are far"""
+        margin = int(self.far_margin)
+        return self.rect.inflate(margin * 2, margin * 2)
+
+    def move_to(self, position: Vector2):
+        """Centers the view on position, kept inside world_bounds
+
+        Args:
+            position (Vector2): World position
+        """
+        x, y = position
+        bounds = self.world_bounds
+        if bounds is not None:
+            x = _clamp(x, bounds.left, bounds.right, self.width)
+            y = _clamp(y, bounds.top, bounds.bottom, self.height)
+
+        self.position.update(x, y)
+
+    def follow(self, target: Vector2, smoothing: float = 1.0):
+        """Moves the view toward target. Call once per frame
+
+        Args:
+            target (Vector2): World position to center on, e.g. the player's position
+            smoothing (float, optional): Fraction of the distance moved per call. 1.0 snaps to target. Defaults to 1.0.
+        """
+        self.move_to(self.position.lerp(target, smoothing))
+
+    def world_to_screen(self, point: Vector2 | tuple[float, float]) -> Vector2:
+        """Converts a world position to a screen position
+
+        Args:
+            point (Vector2 | tuple[float, float]): World position
+
+        Returns:
+            Vector2: Screen position
+        """
+        return Vector2(point) - self.offset
+
+    def screen_to_world(self, point: Vector2 | tuple[float, float]) -> Vector2:
+        """Converts a screen position, e.g. the mouse, to a world position
+
+        Args:
+            point (Vector2 | tuple[float, float]): Screen position
+
+        Returns:
+            Vector2: World position
+        """
+        return Vector2(point) + self.offset
+
+    def apply(self, rect: Rect) -> Rect:
+        """Moves a world rect to where it appears on screen
+
+        Args:
+            rect (Rect): World rect
+
+        Returns:
+            Rect: Screen rect
+        """
+        x, y = self.offset
+        return rect.move(-int(x), -int(y))
+
+    def visible(self, group: Iterable[Sprite]) -> list[Sprite]:
+        """Sprites whose rect overlaps the view. Uses the index of a SpatialGroup
+
+        Args:
+            group (Iterable[Sprite]): Sprite group, or any iterable of sprites with rect
+
+        Returns:
+            list[Sprite]: The visible sprites
+        """
+        view = self.rect
+        if isinstance(group, SpatialGroup):
+            return group.query_rect(view)
+
+        return [sprite for sprite in group if view.colliderect(sprite.rect)]
+
+    def update_sprites(self, group: Iterable[Sprite], dt: float, *args, **kwargs: Any):
+        """Calls update(dt, *args, **kwargs) on every sprite near the view, and on sprites
+        beyond far_margin once every far_interval frames with the time they skipped.
+        Far sprites are spread across frames. Call once per game loop
+
+        Args:
+            group (Iterable[Sprite]): The sprites, e.g. SpriteGame.other_sprites_group
+            dt (float): The change in time
+        """
+        near_rect = self.near_rect
+        interval = self.far_interval
+        frame = self.frame
+        self.frame += 1
+
+        for sprite in list(group):
+            if near_rect.colliderect(sprite.rect):
+                elapsed = self._elapsed.pop(sprite, 0.0) + dt
+                sprite.update(elapsed, *args, **kwargs)
+                continue
+
+            elapsed = self._elapsed.get(sprite, 0.0) + dt
+            phase = self._phases.get(sprite)
+            if phase is None:
+                phase = self._phases[sprite] = len(self._phases) % interval
+
+            if frame % interval == phase:
+                self._elapsed.pop(sprite, None)
+                sprite.update(elapsed, *args, **kwargs)
+            else:
+                self._elapsed[sprite] = elapsed
+
+
+def _clamp(center: float, low: float, high: float, size: float) -> float:
+    # centered when the view is larger than the bounds
+    if high - low <= size:
+        return (low + high) / 2
+
+    return min(max(center, low + size / 2), high - size / 2)
@@ -1,10 +1,14 @@
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from enum import Enum
-from typing import Any, Literal, TypedDict
+from itertools import chain
+from typing import Any, ClassVar, Literal, NamedTuple, NotRequired, TypedDict
+from weakref import WeakSet
 
+import numpy as np
 import pygame.joystick
 import pygame.key
+import pygame.mouse
 from pygame import K_DOWN, K_ESCAPE, K_LEFT, K_RIGHT, K_UP, Vector2
 
 
@@ -12,14 +16,79 @@ class VectorAction(TypedDict):
     """Mapping of controller ID to action
 
     Args:
-        input_id (int): The unique id of the button or axis
-        action_type (str): Axis or button type. Only [axis, button] allowed
+        input_id (int): The unique id of the button, axis or hat
+        action_type (str): Axis, button or hat type. Only [axis, button, hat] allowed
         action_name (str): The name of the action. Should be unique
+        hat_axis (str, optional): Which hat component is the action's value, -1, 0 or 1. Only [x, y] allowed. Defaults to x
     """
 
     input_id: int
     action_type: Literal["axis", "button", "hat"]
     action_name: str
+    hat_axis: NotRequired[Literal["x", "y"]]
+
+
+class JoystickState(NamedTuple):
+    """Immutable state of one joystick
+
+    Args:
+        axes (tuple[float, ...]): Value of every axis
+        buttons (tuple[bool, ...]): Whether every button is pressed
+        hats (tuple[tuple[int, int], ...]): Position of every hat
+    """
+
+    axes: tuple[float, ...]
+    buttons: tuple[bool, ...]
+    hats: tuple[tuple[int, int], ...]
+
+    @staticmethod
+    def capture(joystick: pygame.joystick.JoystickType) -> "JoystickState":
+        return JoystickState(
+            axes=tuple(joystick.get_axis(i) for i in range(joystick.get_numaxes())),
+            buttons=tuple(
+                bool(joystick.get_button(i)) for i in range(joystick.get_numbuttons())
+            ),
+            hats=tuple(joystick.get_hat(i) for i in range(joystick.get_numhats())),
+        )
+
+
+class InputSnapshot(NamedTuple):
+    """Immutable state of every input device at one moment. Game.run captures one
+    per frame with Controller.refresh_input(), and every Controller reads from it
+
+    Args:
+        keys (pygame.key.ScancodeWrapper): Keyboard state, indexable by pygame key constants
+        joysticks (dict[int, JoystickState]): State of every registered joystick by instance id
+        mouse_position (tuple[int, int]): Mouse cursor position
+        mouse_buttons (tuple[bool, ...]): Whether every mouse button is pressed
+    """
+
+    keys: pygame.key.ScancodeWrapper
+    joysticks: dict[int, JoystickState]
+    mouse_position: tuple[int, int]
+    mouse_buttons: tuple[bool, ...]
+
+    @staticmethod
+    def capture(
+        joysticks: Iterable[pygame.joystick.JoystickType] = (),
+    ) -> "InputSnapshot":
+        """Polls every input device once
+
+        Args:
+            joysticks (Iterable[pygame.joystick.JoystickType], optional): Joysticks to poll. Defaults to ().
+
+        Returns:
+            InputSnapshot: The current input state
+        """
+        return InputSnapshot(
+            keys=pygame.key.get_pressed(),
+            joysticks={
+                joystick.get_instance_id(): JoystickState.capture(joystick)
+                for joystick in joysticks
+            },
+            mouse_position=pygame.mouse.get_pos(),
+            mouse_buttons=pygame.mouse.get_pressed(),
+        )
 
 
 class Controller:
@@ -28,6 +97,12 @@ class Controller:
     Optional rotation and action methods
     """
 
+    # shared input state for this frame. Controllers poll devices directly when None
+    snapshot: ClassVar[InputSnapshot | None] = None
+    # controllers whose joysticks refresh_input polls. Held weakly, so
+    # controllers that are no longer used stop being polled
+    _joystick_controllers: ClassVar["WeakSet[JoystickController]"] = WeakSet()
+
     def __init__(
         self,
         speed: float,
@@ -46,6 +121,50 @@ class Controller:
         self.actions: dict[str, VectorAction] = {v["action_name"]: v for v in args}
         self.actions.update(kwargs)
 
+    @staticmethod
+    def refresh_input() -> InputSnapshot:
+        """Captures a new InputSnapshot shared by every controller until the next refresh.
+        Called by Game.run once per frame
+
+        Returns:
+            InputSnapshot: The new snapshot
+        """
+        Controller.snapshot = InputSnapshot.capture(
+            Controller.registered_joysticks().values()
+        )
+        return Controller.snapshot
+
+    @staticmethod
+    def registered_joysticks() -> dict[int, pygame.joystick.JoystickType]:
+        """Joysticks polled by refresh_input: those of every JoystickController in use,
+        skipping joysticks that are no longer initialized
+
+        Returns:
+            dict[int, pygame.joystick.JoystickType]: Joysticks by instance id
+        """
+        return {
+            controller.instance_id: controller.input
+            for controller in list(Controller._joystick_controllers)
+            if _joystick_initialized(controller.input)
+        }
+
+    @staticmethod
+    def unregister_joystick(instance_id: int):
+        """Stops polling a joystick for every controller using it. Called by Game.run
+        when the device is removed
+
+        Args:
+            instance_id (int): The joystick's instance id
+        """
+        for controller in list(Controller._joystick_controllers):
+            if controller.instance_id == instance_id:
+                Controller._joystick_controllers.discard(controller)
+
+    @staticmethod
+    def clear_input():
+        """Drops the shared snapshot, so controllers poll devices directly"""
+        Controller.snapshot = None
+
     @abstractmethod
     def direction(self) -> Vector2:
         """Applies direction from controller input
@@ -109,6 +228,12 @@ class JoystickController(Controller):
         """
         super(JoystickController, self).__init__(speed, *args, **kwargs)
         self.input = input
+        self.instance_id = input.get_instance_id()
+        Controller._joystick_controllers.add(self)
+
+    def close(self):
+        """Stops refresh_input polling this controller's joystick for it"""
+        Controller._joystick_controllers.discard(self)
 
     def action(self, key: str) -> float:
         """Vector actions for Keyboard input
@@ -124,9 +249,24 @@ class JoystickController(Controller):
         if vector_action is not None:
             id = vector_action["input_id"]
             action_type = vector_action["action_type"]
+            state = (
+                self.snapshot.joysticks.get(self.instance_id)
+                if self.snapshot is not None
+                else None
+            )
+            if state is not None:
+                if action_type == "axis":
+                    return state.axes[id]
+                elif action_type == "hat":
+                    return float(state.hats[id][_hat_component(vector_action)])
+                else:
+                    return 1.0 if state.buttons[id] else 0.0
+
             if action_type == "axis":
                 axis = self.input.get_axis(id)
                 return axis
+            elif action_type == "hat":
+                return float(self.input.get_hat(id)[_hat_component(vector_action)])
             else:
                 return 1.0 if self.input.get_button(id) else 0.0
 
@@ -156,7 +296,12 @@ class KeyboardController(Controller):
 
         if vector_action is not None:
             id = vector_action["input_id"]
-            if pygame.key.get_pressed()[id]:
+            keys = (
+                self.snapshot.keys
+                if self.snapshot is not None
+                else pygame.key.get_pressed()
+            )
+            if keys[id]:
                 return 1.0
 
         return 0.0
@@ -193,6 +338,178 @@ class DefaultKeyboardController(KeyboardController):
         return Vector2(vx, vy)
 
 
+class ControllerGroup:
+    """Evaluates the actions of many controllers in one vectorized pass.
+    Action maps are compiled into an index table over a flat array holding every key,
+    joystick axis, button and hat component, so each frame is one NumPy gather
+    """
+
+    def __init__(
+        self,
+        controllers: Sequence[Controller],
+        action_names: Sequence[str] | None = None,
+    ):
+        """Creates new instance of ControllerGroup object. Compiles the controllers' current
+        actions, so create a new group if they change. Needs pygame initialized
+
+        Args:
+            controllers (Sequence[Controller]): The controllers, one row each in results
+            action_names (Sequence[str] | None, optional): The actions, one column each in results. Every action of every controller if None. Defaults to None.
+        """
+        self.controllers = list(controllers)
+        self.action_names = list(
+            action_names
+            if action_names is not None
+            else dict.fromkeys(name for c in controllers for name in c.actions)
+        )
+        self.speeds = np.array([c.speed for c in self.controllers], dtype=float)
+        self._columns = {name: j for j, name in enumerate(self.action_names)}
+
+        # flat input layout: [zero, keys..., per joystick: axes, buttons, hat x/y pairs]
+        n_keys = len(pygame.key.get_pressed())
+        scancodes = pygame.key.ScancodeWrapper(range(n_keys))
+        self._n_keys = n_keys
+        self._joysticks: list[tuple[pygame.joystick.JoystickType, int, int, int]] = []
+        self._fallback: list[int] = []
+        self._table = np.zeros(
+            (len(self.controllers), len(self.action_names)), dtype=np.intp
+        )
+
+        offset = 1 + n_keys
+        for row, controller in enumerate(self.controllers):
+            if isinstance(controller, KeyboardController):
+                for name, action in controller.actions.items():
+                    if name in self._columns:
+                        self._table[row, self._columns[name]] = (
+                            1 + scancodes[action["input_id"]]
+                        )
+
+            elif isinstance(controller, JoystickController):
+                joystick = controller.input
+                n_axes = joystick.get_numaxes()
+                n_buttons = joystick.get_numbuttons()
+                n_hats = joystick.get_numhats()
+                self._joysticks.append((joystick, n_axes, n_buttons, n_hats))
+
+                for name, action in controller.actions.items():
+                    if name not in self._columns:
+                        continue
+
+                    id = action["input_id"]
+                    action_type = action["action_type"]
+                    if action_type == "axis" and id < n_axes:
+                        index = offset + id
+                    elif action_type == "hat" and id < n_hats:
+                        index = (
+                            offset
+                            + n_axes
+                            + n_buttons
+                            + id * 2
+                            + _hat_component(action)
+                        )
+                    elif action_type == "button" and id < n_buttons:
+                        index = offset + n_axes + id
+                    else:
+                        continue
+                    self._table[row, self._columns[name]] = index
+
+                offset += n_axes + n_buttons + n_hats * 2
+
+            else:
+                # unknown controller types are evaluated with action()
+                self._fallback.append(row)
+
+    def evaluate(self, snapshot: InputSnapshot | None = None) -> np.ndarray:
+        """Every action of every controller
+
+        Args:
+            snapshot (InputSnapshot | None, optional): Input state. Controller.snapshot, or a new capture, if None. Defaults to None.
+
+        Returns:
+            np.ndarray: Shape (controllers, actions). 0.0 where a controller lacks an action
+        """
+        if snapshot is None:
+            snapshot = Controller.snapshot
+        if snapshot is None:
+            snapshot = InputSnapshot.capture(j for j, *_ in self._joysticks)
+
+        parts = [np.zeros(1), np.asarray(snapshot.keys, dtype=float)]
+        for joystick, n_axes, n_buttons, n_hats in self._joysticks:
+            size = n_axes + n_buttons + n_hats * 2
+            state = snapshot.joysticks.get(joystick.get_instance_id())
+            if state is None:
+                parts.append(np.zeros(size))
+            else:
+                parts.append(
+                    np.fromiter(
+                        chain(
+                            state.axes[:n_axes],
+                            state.buttons[:n_buttons],
+                            chain.from_iterable(state.hats[:n_hats]),
+                        ),
+                        dtype=float,
+                        count=size,
+                    )
+                )
+
+        values = np.concatenate(parts)[self._table]
+        for row in self._fallback:
+            controller = self.controllers[row]
+            for j, name in enumerate(self.action_names):
+                if name in controller.actions:
+                    values[row, j] = controller.action(name)
+
+        return values
+
+    def action(self, key: str, snapshot: InputSnapshot | None = None) -> np.ndarray:
+        """One action of every controller
+
+        Args:
+            key (str): The unique key(name) of the action
+            snapshot (InputSnapshot | None, optional): Input state. Defaults to None.
+
+        Returns:
+            np.ndarray: Shape (controllers,)
+        """
+        return self.evaluate(snapshot)[:, self._columns[key]]
+
+    def directions(self, snapshot: InputSnapshot | None = None) -> np.ndarray:
+        """Direction of every controller, computed like DefaultKeyboardController.direction
+        from the x/y axis pos/neg actions and each controller's speed
+
+        Args:
+            snapshot (InputSnapshot | None, optional): Input state. Defaults to None.
+
+        Returns:
+            np.ndarray: Shape (controllers, 2)
+        """
+        values = self.evaluate(snapshot)
+        commands = DefaultKeyboardController.Commands
+
+        def column(command: DefaultKeyboardController.Commands) -> np.ndarray:
+            j = self._columns.get(command.value)
+            return values[:, j] if j is not None else np.zeros(len(values))
+
+        directions = np.empty((len(values), 2))
+        directions[:, 0] = column(commands.X_AXIS_POS) - column(commands.X_AXIS_NEG)
+        directions[:, 1] = column(commands.Y_AXIS_POS) - column(commands.Y_AXIS_NEG)
+        directions *= self.speeds[:, None]
+
+        return directions
+
+
+def _hat_component(action: VectorAction) -> int:
+    return 1 if action.get("hat_axis", "x") == "y" else 0
+
+
+def _joystick_initialized(joystick: pygame.joystick.JoystickType) -> bool:
+    try:
+        return bool(joystick.get_init())
+    except pygame.error:
+        # the joystick module was quit
+        return False
+
+
 DEFAULT_KEYBOARD_ACTIONS: list[VectorAction] = [
     {
         "input_id": K_RIGHT,
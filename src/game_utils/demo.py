@@ -8,6 +8,7 @@ from pygame import Rect, Surface, Vector2
 
 from game_utils.controller import DEFAULT_KEYBOARD_ACTIONS, DefaultKeyboardController
 from game_utils.game import SpriteGame
+from game_utils.images import get_circle_image
 from game_utils.physics import PhysicsBody
 from game_utils.screen import ScreenSettings
 from game_utils.sprites import PhysicsSprite, PlayerSprite
@@ -42,7 +43,7 @@ class BouncyBallPlayer(PlayerSprite, BouncyBallSprite):
 
         # sync position and physics body
         accel = self.controller.direction()
-        self.physics_body.force(accel, dt)
+        self.physics_body.force_inplace(accel, dt)
 
         # bound position with physics body
         self._update_pos(
@@ -143,34 +144,39 @@ class BouncyBallSettings(ScreenSettings):
             frames_per_second=frames_per_second,
             bg_color=bg_color,
             bg_image=bg_image,
+            dirty_rects=True,
         )
         self.puck = puck
         self.player = player
+        # the table never changes, so draw it once into the static background
+        self.add_static(self.__draw_table)
 
-    def update_screen(self):
-        # DRAW THE TABLE
+    def __draw_table(self, surface: Surface):
+        surface.fill("black")
         draw.rect(
-            surface=self.screen,
+            surface=surface,
             color=self.bg_color or "black",
             rect=(0, 0, self.width, self.height),
             border_radius=15,
         )
-        # DRAW PLAYER
-        draw.circle(
-            self.screen,
-            self.player.color,
-            self.player.position,
-            self.player.rect.h,
-        )
 
-        # DRAW PUCK
-        draw.circle(
-            self.screen,
-            self.puck.color,
-            self.puck.position,
-            self.puck.rect.h,
+    def update_screen(self):
+        # only the balls are drawn each frame, the
+        # table behind them is restored by clear_screen()
+        # circles are rasterized once and blitted together
+        balls = (self.player, self.puck)
+        rects = self.screen.blits(
+            [
+                (
+                    get_circle_image(ball.color, ball.rect.h),
+                    ball.position - (ball.rect.h, ball.rect.h),
+                )
+                for ball in balls
+            ]
         )
 
+        self.mark_dirty(*rects)
+
 
 class BouncyBall(SpriteGame):
     """This is where high-level game logic goes
@@ -201,7 +207,7 @@ class BouncyBall(SpriteGame):
         self.player_sprite.update(self.dt)
 
     def __update_puck(self):
-        self.puck.physics_body.move(self.dt)
+        self.puck.physics_body.move_inplace(self.dt)
         self.puck.update()
 
     def update_sprites(self):
@@ -0,0 +1,472 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, NamedTuple
+
+import numpy as np
+from pygame import Rect, Surface, Vector2
+
+from .physics import apply_force
+from .sprites import GameSprite, PhysicsSprite, PlayerSprite, clamp_to_bounds
+
+
+class Component(NamedTuple):
+    """Describes one column of archetype storage
+
+    Args:
+        name (str): Unique name, the keyword used by EntityWorld.spawn
+        dtype (Any, optional): NumPy dtype of the column. object for references, e.g. images. Defaults to float.
+        shape (tuple[int, ...], optional): Shape of one entity's value. Defaults to ().
+        default (Any, optional): Value given when an entity gains the component without one. Defaults to 0.
+    """
+
+    name: str
+    dtype: Any = float
+    shape: tuple[int, ...] = ()
+    default: Any = 0
+
+
+POSITION = Component("position", float, (2,))
+VELOCITY = Component("velocity", float, (2,))
+ACCELERATION = Component("acceleration", float, (2,))
+SIZE = Component("size", float, (2,))
+BOUNDARIES = Component("boundaries", float, (4,))
+MASS = Component("mass", float, (), 1.0)
+STATIC_FRICTION = Component("static_friction", float)
+KINETIC_FRICTION = Component("kinetic_friction", float)
+ELASTICITY = Component("elasticity", float)
+IMAGE = Component("image", object, (), None)
+CONTROLLER = Component("controller", object, (), None)
+SPRITE = Component("sprite", object, (), None)
+
+DEFAULT_COMPONENTS = (
+    POSITION,
+    VELOCITY,
+    ACCELERATION,
+    SIZE,
+    BOUNDARIES,
+    MASS,
+    STATIC_FRICTION,
+    KINETIC_FRICTION,
+    ELASTICITY,
+    IMAGE,
+    CONTROLLER,
+    SPRITE,
+)
+
+PHYSICS = ("position", "velocity", "mass", "static_friction", "kinetic_friction")
+
+
+class Archetype:
+    """Stores every entity with exactly the same set of components, one contiguous
+    array per component. Rows are kept packed, removal swaps in the last row
+    """
+
+    def __init__(self, components: Iterable[Component], capacity: int = 64):
+        """Creates new instance of Archetype object
+
+        Args:
+            components (Iterable[Component]): The components of every entity stored here
+            capacity (int, optional): Initial number of rows allocated. Grows as needed. Defaults to 64.
+        """
+        self.components = {c.name: c for c in components}
+        self.names = frozenset(self.components)
+        self.count = 0
+        self._entities = np.empty(max(capacity, 1), dtype=np.intp)
+        self._arrays = {
+            c.name: np.empty((len(self._entities), *c.shape), dtype=c.dtype)
+            for c in self.components.values()
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Live view of a component's column for the stored entities
+
+        Args:
+            name (str): The component name
+
+        Returns:
+            np.ndarray: Shape (count, *component.shape)
+        """
+        return self._arrays[name][: self.count]
+
+    @property
+    def entities(self) -> np.ndarray:
+        """Live (count,) view of the entity ids, in row order"""
+        return self._entities[: self.count]
+
+    def append(self, entity: int, values: dict[str, Any]) -> int:
+        """Adds a row. Components missing from values get their default
+
+        Args:
+            entity (int): The entity id
+            values (dict[str, Any]): Component values by name
+
+        Returns:
+            int: The new row
+        """
+        if self.count == len(self._entities):
+            self._grow(len(self._entities) * 2)
+
+        row = self.count
+        self._entities[row] = entity
+        for name, array in self._arrays.items():
+            array[row] = values.get(name, self.components[name].default)
+        self.count += 1
+
+        return row
+
+    def row_values(self, row: int) -> dict[str, Any]:
+        """Component values of one row, copied out of the arrays
+
+        Args:
+            row (int): The row
+
+        Returns:
+            dict[str, Any]: Values by component name
+        """
+        return {
+            name: array[row] if array.dtype == object else array[row].copy()
+            for name, array in self._arrays.items()
+        }
+
+    def swap_remove(self, row: int) -> int | None:
+        """Removes a row by moving the last row into it
+
+        Args:
+            row (int): The row to remove
+
+        Returns:
+            int | None: Entity id of the row moved into row, or None if row was last
+        """
+        last = self.count - 1
+        moved = None
+        if row != last:
+            self._entities[row] = self._entities[last]
+            for array in self._arrays.values():
+                array[row] = array[last]
+            moved = int(self._entities[row])
+
+        # drop references held by object columns
+        for array in self._arrays.values():
+            if array.dtype == object:
+                array[last] = None
+        self.count -= 1
+
+        return moved
+
+    def _grow(self, capacity: int):
+        entities = np.empty(capacity, dtype=np.intp)
+        entities[: self.count] = self.entities
+        self._entities = entities
+
+        for name, array in self._arrays.items():
+            grown = np.empty((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[: self.count] = array[: self.count]
+            self._arrays[name] = grown
+
+
+System = Callable[[Archetype, float], None]
+
+
+class EntityWorld:
+    """Entity-component-system storage. Entities are integer ids, their components
+    live in the arrays of the archetype matching their component set, and systems
+    run once per archetype over whole columns. An optional alternative to sprite
+    objects for large entity counts
+    """
+
+    def __init__(
+        self,
+        *components: Component,
+        capacity: int = 64,
+    ):
+        """Creates new instance of EntityWorld object
+
+        Args:
+            *components (Component): Custom components, in addition to DEFAULT_COMPONENTS
+            capacity (int, optional): Initial rows allocated per archetype. Defaults to 64.
+        """
+        self.capacity = capacity
+        self.components: dict[str, Component] = {}
+        self.archetypes: dict[frozenset[str], Archetype] = {}
+        self._locations: dict[int, tuple[Archetype, int]] = {}
+        self._systems: list[tuple[System, frozenset[str], frozenset[str]]] = []
+        self._next_entity = 0
+
+        for component in (*DEFAULT_COMPONENTS, *components):
+            self.register(component)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, entity: int) -> bool:
+        return entity in self._locations
+
+    def register(self, component: Component):
+        """Adds a component type that entities can be spawned with
+
+        Args:
+            component (Component): The component
+        """
+        if component.name in self.components:
+            msg = f"Component {component.name} already registered"
+            raise KeyError(msg)
+
+        self.components[component.name] = component
+
+    def spawn(self, **components: Any) -> int:
+        """Creates an entity
+
+        Args:
+            **components: Component values by name, e.g. position=(0, 0)
+
+        Returns:
+            int: The entity id
+        """
+        entity = self._next_entity
+        self._next_entity += 1
+        self._place(entity, components)
+
+        return entity
+
+    def despawn(self, entity: int):
+        """Removes an entity and its components
+
+        Args:
+            entity (int): The entity id
+        """
+        archetype, row = self._locations.pop(entity)
+        self._remove_row(archetype, row)
+
+    def get(self, entity: int, name: str) -> Any:
+        """A component of an entity. Array components are live views
+
+        Args:
+            entity (int): The entity id
+            name (str): The component name
+
+        Returns:
+            Any: The component value
+        """
+        archetype, row = self._locations[entity]
+        return archetype[name][row]
+
+    def set(self, entity: int, name: str, value: Any):
+        """Sets a component of an entity, moving it to another archetype if it lacks the component
+
+        Args:
+            entity (int): The entity id
+            name (str): The component name
+            value (Any): The new value
+        """
+        archetype, row = self._locations[entity]
+        if name in archetype:
+            archetype._arrays[name][row] = value
+            return
+
+        values = archetype.row_values(row)
+        values[name] = value
+        self._move(entity, values)
+
+    def discard(self, entity: int, name: str):
+        """Removes a component from an entity, moving it to another archetype
+
+        Args:
+            entity (int): The entity id
+            name (str): The component name
+        """
+        archetype, row = self._locations[entity]
+        if name not in archetype:
+            return
+
+        values = archetype.row_values(row)
+        del values[name]
+        self._move(entity, values)
+
+    def query(self, *names: str, exclude: Iterable[str] = ()) -> Iterator[Archetype]:
+        """Archetypes with entities that have every one of names and none of exclude
+
+        Args:
+            *names (str): Required component names
+            exclude (Iterable[str], optional): Component names that disqualify an archetype. Defaults to ().
+
+        Yields:
+            Archetype: Each matching, non-empty archetype
+        """
+        required = frozenset(names)
+        excluded = frozenset(exclude)
+        for archetype in list(self.archetypes.values()):
+            if (
+                archetype.count
+                and required <= archetype.names
+                and not excluded & archetype.names
+            ):
+                yield archetype
+
+    def add_system(self, system: System, *names: str, exclude: Iterable[str] = ()):
+        """Registers a system, run by run() once for each matching archetype
+
+        Args:
+            system (System): Called with the archetype and dt
+            *names (str): Required component names
+            exclude (Iterable[str], optional): Component names the archetype must not have. Defaults to ().
+        """
+        self._systems.append((system, frozenset(names), frozenset(exclude)))
+
+    def run(self, dt: float):
+        """Runs every system over its archetypes, in the order systems were added
+
+        Args:
+            dt (float): The change in time
+        """
+        for system, names, exclude in self._systems:
+            for archetype in self.query(*names, exclude=exclude):
+                system(archetype, dt)
+
+    def add_sprite(self, sprite: GameSprite, **components: Any) -> int:
+        """Spawns an entity from a sprite's state. The sprite is kept as the sprite
+        component, so sync_sprites() can write the simulated state back to it
+
+        Args:
+            sprite (GameSprite): The sprite. PhysicsSprite adds physics components and PlayerSprite a controller
+            **components: Extra or overriding component values
+
+        Returns:
+            int: The entity id
+        """
+        values: dict[str, Any] = {
+            "position": tuple(sprite.position),
+            "size": sprite.rect.size,
+            "image": sprite.image,
+            "sprite": sprite,
+        }
+        if sprite.boundaries is not None:
+            values["boundaries"] = tuple(sprite.boundaries)
+
+        if isinstance(sprite, PhysicsSprite):
+            body = sprite.physics_body
+            values.update(
+                position=tuple(body.position),
+                velocity=tuple(body.velociy),
+                acceleration=(0.0, 0.0),
+                mass=body.mass,
+                static_friction=body.static_friction,
+                kinetic_friction=body.kinetic_friction,
+                elasticity=body.elasticity,
+            )
+
+        if isinstance(sprite, PlayerSprite):
+            values["controller"] = sprite.controller
+
+        values.update(components)
+        return self.spawn(**values)
+
+    def sync_sprites(self):
+        """Writes the position, rect and velocity of every entity added with add_sprite back to its sprite"""
+        for archetype in self.query("sprite", "position"):
+            positions = archetype["position"]
+            velocities = archetype["velocity"] if "velocity" in archetype else None
+
+            for row, sprite in enumerate(archetype["sprite"]):
+                x, y = positions[row]
+                sprite.position.update(x, y)
+                w, h = sprite.rect.size
+                sprite.rect.topleft = (int(x - w / 2), int(y - h / 2))
+                sprite.notify_moved()
+
+                if isinstance(sprite, PhysicsSprite):
+                    body = sprite.physics_body
+                    body.position = sprite.position
+                    if velocities is not None:
+                        body.velociy = Vector2(*velocities[row])
+
+    def draw(self, surface: Surface) -> list[Rect]:
+        """Blits the image of every entity with an image and position, centered on its position,
+        with one Surface.blits call
+
+        Args:
+            surface (Surface): Where to draw
+
+        Returns:
+            list[Rect]: The drawn regions, e.g. for ScreenSettings.mark_dirty
+        """
+        sequence = []
+        for archetype in self.query("image", "position"):
+            images = archetype["image"]
+            topleft = archetype["position"].astype(int)
+            for row, image in enumerate(images):
+                if image is not None:
+                    w, h = image.get_size()
+                    x, y = topleft[row]
+                    sequence.append((image, (x - w // 2, y - h // 2)))
+
+        return surface.blits(sequence) or []
+
+    def _place(self, entity: int, values: dict[str, Any]):
+        names = frozenset(values)
+        archetype = self.archetypes.get(names)
+        if archetype is None:
+            unknown = names - self.components.keys()
+            if unknown:
+                msg = f"Unregistered components {sorted(unknown)}"
+                raise KeyError(msg)
+
+            archetype = self.archetypes[names] = Archetype(
+                (self.components[name] for name in sorted(names)), self.capacity
+            )
+
+        self._locations[entity] = (archetype, archetype.append(entity, values))
+
+    def _move(self, entity: int, values: dict[str, Any]):
+        # placed before the old row is removed, so if placing raises the entity is kept
+        archetype, row = self._locations[entity]
+        self._place(entity, values)
+        self._remove_row(archetype, row)
+
+    def _remove_row(self, archetype: Archetype, row: int):
+        moved = archetype.swap_remove(row)
+        if moved is not None:
+            self._locations[moved] = (archetype, row)
+
+
+def movement_system(archetype: Archetype, dt: float):
+    """Moves by velocity. Register for ("position", "velocity") excluding "mass",
+    so bodies moved by physics_system are not moved twice
+    """
+    archetype["position"] += archetype["velocity"] * dt
+
+
+def controller_system(archetype: Archetype, dt: float):
+    """Sets acceleration to each controller's direction. Register for ("controller", "acceleration")"""
+    accelerations = archetype["acceleration"]
+    for row, controller in enumerate(archetype["controller"]):
+        if controller is not None:
+            accelerations[row] = controller.direction()
+
+
+def physics_system(archetype: Archetype, dt: float):
+    """Applies acceleration, if present, and friction then moves, same as PhysicsWorld.force.
+    Register for PHYSICS
+    """
+    apply_force(
+        *(archetype[name] for name in PHYSICS),
+        archetype["acceleration"] if "acceleration" in archetype else (0.0, 0.0),
+        dt,
+    )
+
+
+def bounds_system(archetype: Archetype, dt: float):
+    """Clamps positions to boundaries with clamp_to_bounds, reflecting velocities scaled by
+    elasticity if present. Register for ("position", "size", "boundaries")
+    """
+    clamp_to_bounds(
+        archetype["position"],
+        archetype["size"],
+        archetype["boundaries"],
+        archetype["velocity"] if "velocity" in archetype else None,
+        archetype["elasticity"] if "elasticity" in archetype else 1.0,
+    )
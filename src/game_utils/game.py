@@ -1,9 +1,15 @@
+import os
+import time
 from abc import abstractmethod
 from typing import Generic, TypeVar
 
 import pygame
 
+from .controller import Controller
+from .profiling import AllocationTracker, FrameProfiler
+from .replay import InputRecorder, ReplayController
 from .screen import ScreenSettings
+from .spatial import SpatialHash
 from .sprites import GameSprite
 
 
@@ -12,35 +18,210 @@ class Game:
     User is required to implement abstract methods self.update() and self.events(), which is invoked within self.run()
     """
 
-    def __init__(self, screen_settings: ScreenSettings | None = None):
+    def __init__(
+        self,
+        screen_settings: ScreenSettings | None = None,
+        *,
+        fixed_timestep: float | None = None,
+        max_steps: int = 5,
+        profiler: FrameProfiler | None = None,
+        allocation_tracker: AllocationTracker | None = None,
+        recorder: InputRecorder | None = None,
+        replay: ReplayController | None = None,
+    ):
         """High level game orchestrations
 
         Args:
             screen_settings (ScreenSettings): Any screen settings
+            fixed_timestep (float | None, optional): Seconds per update() in fixed timestep mode. Variable timestep if None. Defaults to None.
+            max_steps (int, optional): Most update() calls per frame in fixed timestep mode. Defaults to 5.
+            profiler (FrameProfiler | None, optional): Times each phase of the game loop. Defaults to None.
+            allocation_tracker (AllocationTracker | None, optional): Reports allocations per frame. Slow, for diagnostics only. Defaults to None.
+            recorder (InputRecorder | None, optional): Records dt and controller input before every update. Defaults to None.
+            replay (ReplayController | None, optional): Replays a recording, setting dt before every update. The game stops when it ends. Defaults to None.
         """
-        self.dt = 0
+        self.dt = 0 if fixed_timestep is None else fixed_timestep
         self.running = False
         self.screen_settings = screen_settings
+        self.fixed_timestep = fixed_timestep
+        self.max_steps = max_steps
+        self.profiler = profiler
+        self.allocation_tracker = allocation_tracker
+        self.recorder = recorder
+        self.replay = replay
+        self.alpha = 1.0
+        self.dropped_steps = 0
+        self.ticks = 0
+        self._accumulator = 0.0
+        self._run_time = 0.0
+
+    @property
+    def headless(self) -> bool:
+        """True if the screen settings draw offscreen"""
+        return self.screen_settings is not None and self.screen_settings.headless
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Game loops per second achieved over the current or last run"""
+        return self.ticks / self._run_time if self._run_time > 0 else 0.0
 
-    def run(self):
+    def run(self, max_ticks: int | None = None):
         """Runs and maintains the game loop and clock. Updates the screen and invokes any handlers
         Invokes pygame.init(), pygame.quit() when pygame.QUIT event is reached
+
+        Args:
+            max_ticks (int | None, optional): Stop after this many game loops. Runs until quit if None. Defaults to None.
         """
-        pygame.init()
+        self._init_pygame()
         self.running = True
-        while self.running:
-            self.update()
-            if self.screen_settings is not None:
-                self.screen_settings.update_screen()
-                self.dt = self.screen_settings.get_delta_time()
-                pygame.display.flip()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+        self.ticks = 0
+        frame_time = 0.0
+        start_time = last_time = time.perf_counter()
+        profiler = self.profiler
+        lap = 0.0
+        if self.allocation_tracker is not None:
+            self.allocation_tracker.start()
+
+        try:
+            while self.running:
+                if profiler is not None:
+                    lap = time.perf_counter()
+
+                # one input poll per frame, shared by every controller
+                if pygame.display.get_init():
+                    Controller.refresh_input()
+                if profiler is not None:
+                    lap = profiler.lap("input", lap)
+
+                if self.fixed_timestep is None:
+                    self._update()
+                else:
+                    self.advance(frame_time)
+
+                if profiler is not None:
+                    lap = profiler.lap("update", lap)
+
+                if self.screen_settings is not None:
+                    self.screen_settings.clear_screen()
+                    self.screen_settings.update_screen()
+                    if profiler is not None:
+                        lap = profiler.lap("update_screen", lap)
+
+                    frame_time = self.screen_settings.get_delta_time()
+                    if self.fixed_timestep is None:
+                        self.dt = frame_time
+                    if profiler is not None:
+                        lap = profiler.lap("tick", lap)
+                        if profiler.overlay:
+                            self.screen_settings.mark_dirty(
+                                profiler.draw_overlay(self.screen_settings.screen)
+                            )
+                            lap = profiler.lap("overlay", lap)
+
+                    self.screen_settings.flip()
+                    if profiler is not None:
+                        lap = profiler.lap("flip", lap)
+                elif self.fixed_timestep is not None:
+                    now = time.perf_counter()
+                    frame_time = now - last_time
+                    last_time = now
+
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.JOYDEVICEREMOVED:
+                        Controller.unregister_joystick(event.instance_id)
+                    self.events(event)
+
+                if profiler is not None:
+                    profiler.lap("events", lap)
+                    profiler.end_frame()
+                if self.allocation_tracker is not None:
+                    self.allocation_tracker.end_frame()
+
+                self.ticks += 1
+                self._run_time = time.perf_counter() - start_time
+                if max_ticks is not None and self.ticks >= max_ticks:
                     self.running = False
-                self.events(event)
+        finally:
+            # an exception in update() must not leave the profile hook installed
+            if self.allocation_tracker is not None:
+                self.allocation_tracker.stop()
+
+        if self.recorder is not None:
+            self.recorder.flush()
 
+        Controller.clear_input()
         pygame.quit()
 
+    def _init_pygame(self):
+        """Invokes pygame.init(). In headless mode the event queue still needs a video
+        driver, so the dummy driver is used unless one is set. The environment is
+        restored afterwards, so later games in the process aren't affected
+        """
+        if not self.headless or "SDL_VIDEODRIVER" in os.environ:
+            pygame.init()
+            return
+
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        try:
+            pygame.init()
+        finally:
+            del os.environ["SDL_VIDEODRIVER"]
+
+    def advance(self, frame_time: float) -> int:
+        """Adds frame_time to the fixed timestep accumulator and calls update() once per
+        whole step, at most max_steps times. Steps beyond that are dropped so a slow frame
+        can't snowball. Sets alpha, the fraction of a step left over, for render interpolation
+
+        Args:
+            frame_time (float): Seconds since the last frame
+
+        Returns:
+            int: The number of times update() was called
+        """
+        assert self.fixed_timestep is not None
+
+        step = self.fixed_timestep
+        self._accumulator += frame_time
+        steps = 0
+        while self._accumulator >= step and steps < self.max_steps:
+            self.dt = step
+            if not self._update():
+                break
+            self._accumulator -= step
+            steps += 1
+
+        if self._accumulator >= step:
+            # too far behind to catch up, drop the backlog
+            self.dropped_steps += int(self._accumulator // step)
+            self._accumulator %= step
+
+        self.alpha = self._accumulator / step
+        if self.screen_settings is not None:
+            self.screen_settings.alpha = self.alpha
+
+        return steps
+
+    def _update(self) -> bool:
+        """Calls update() once, replaying or recording dt and input if configured
+
+        Returns:
+            bool: False if a replay has ended and update() was not called
+        """
+        if self.replay is not None:
+            dt = self.replay.advance()
+            if dt is None:
+                self.running = False
+                return False
+            self.dt = dt
+
+        if self.recorder is not None:
+            self.recorder.record(self.dt)
+
+        self.update()
+        return True
+
     def events(self, event: pygame.event.Event, *args, **kwargs):
         """Define custom event handlers.  Optional.  Called once per game loop
 
@@ -66,6 +247,9 @@ class SpriteGame(Game):
         screen_settings: ScreenSettings,
         player_sprite: GameSprite,
         *other_sprites: GameSprite,
+        broad_phase: SpatialHash | None = None,
+        sprite_group: pygame.sprite.AbstractGroup | None = None,
+        **kwargs,
     ):
         """Create new instance of SpriteGame object.  Invokes pygame.init().  Must
         implement update_sprites()
@@ -74,10 +258,31 @@ class SpriteGame(Game):
             settings (ScreenSettings): Information needed to update the screen
             player_sprite (GameSprite): The sprite to be used for the player
             *other_sprites (GameSprite): Any other sprites needed for the game
+            broad_phase (SpatialHash | None, optional): Grid used by collision_candidates(). Created on first use if None. Defaults to None.
+            sprite_group (pygame.sprite.AbstractGroup | None, optional): Group to hold other_sprites, e.g. a SpatialGroup for region queries. A new Group if None. Defaults to None.
+            **kwargs: Passed to Game
         """
-        super().__init__(screen_settings=screen_settings)
+        super().__init__(screen_settings=screen_settings, **kwargs)
         self.player_sprite: GameSprite = player_sprite
-        self.other_sprites_group = pygame.sprite.Group(other_sprites)
+        self.other_sprites_group = (
+            sprite_group if sprite_group is not None else pygame.sprite.Group()
+        )
+        self.other_sprites_group.add(*other_sprites)
+        self.broad_phase = broad_phase
+
+    def collision_candidates(self) -> set[tuple[GameSprite, GameSprite]]:
+        """Updates the broad phase with the player and other sprites and returns
+        pairs of sprites close enough to collide. Call once per game loop, after sprites move
+
+        Returns:
+            set[tuple[GameSprite, GameSprite]]: Candidate pairs for a narrow phase check
+        """
+        if self.broad_phase is None:
+            self.broad_phase = SpatialHash()
+
+        self.broad_phase.sync([self.player_sprite, *self.other_sprites_group.sprites()])
+
+        return self.broad_phase.candidate_pairs()
 
     @abstractmethod
     def update_sprites(self):
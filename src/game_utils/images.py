@@ -1,16 +1,63 @@
-from pygame import Rect, Surface
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+import pygame.draw
+import pygame.transform
+from pygame import SRCALPHA, Color, Rect, Surface
+
+
+def get_circle_image(color: str | tuple[int, int, int] | Color, radius: int) -> Surface:
+    """A circle rasterized once per color and radius, for blitting instead of draw.circle
+
+    Args:
+        color (str | tuple[int, int, int] | Color): The circle color
+        radius (int): The circle radius
+
+    Returns:
+        Surface: Transparent (2 * radius, 2 * radius) image. Shared between calls
+    """
+    return _circle_image(tuple(Color(color)), int(radius))
+
+
+@lru_cache(maxsize=256)
+def _circle_image(color: tuple[int, ...], radius: int) -> Surface:
+    image = Surface((radius * 2, radius * 2), SRCALPHA)
+    pygame.draw.circle(image, color, (radius, radius), radius)
+    return image
 
 
 class SpriteSheet:
     """Allows user to access segements of a sprite sheet"""
 
-    def __init__(self, spritesheet: Surface, bg_color: str | None = None) -> None:
+    def __init__(
+        self,
+        spritesheet: Surface,
+        bg_color: str | None = None,
+        cache_size: int = 0,
+        subsurface: bool = False,
+    ) -> None:
+        """Creates new instance of SpriteSheet object
+
+        Args:
+            spritesheet (Surface): The sprite sheet image
+            bg_color (str | None, optional): Color filled behind each segment. Defaults to None.
+            cache_size (int, optional): Most segments kept after extraction, least recently used are evicted first. No caching if 0. Defaults to 0.
+            subsurface (bool, optional): Return segments that share pixels with the sheet instead of copies. Ignored when bg_color is set. Defaults to False.
+        """
         self.spritesheet = spritesheet
         self.rect = self.spritesheet.get_rect()
         self.bg_color = bg_color
+        self.cache_size = cache_size
+        self.subsurface = subsurface
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: OrderedDict[tuple, Surface] = OrderedDict()
 
     def get_spritesheet_segment(self, rect: Rect) -> Surface:
-        """Get a segment of the spritesheet using the given coordinates
+        """Get a segment of the spritesheet using the given coordinates.
+        Cached segments are shared between calls, so copy one before drawing on it
 
         Args:
             rect (Rect): The coordinates of the segment you want me to find in the spritesheet
@@ -18,6 +65,32 @@ class SpriteSheet:
         Returns:
             Surface: The sprite from the spritesheet using the given coordinates
         """
+        if self.cache_size <= 0:
+            return self._extract_segment(rect)
+
+        key = (tuple(rect), self.bg_color)
+        image = self._cache.get(key)
+        if image is not None:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return image
+
+        self.cache_misses += 1
+        image = self._cache[key] = self._extract_segment(rect)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return image
+
+    def clear_cache(self):
+        """Drops every cached segment"""
+        self._cache.clear()
+
+    def _extract_segment(self, rect: Rect) -> Surface:
+        if self.subsurface and self.bg_color is None and self.rect.contains(rect):
+            # a view into the sheet's pixels, no copy
+            return self.spritesheet.subsurface(rect)
+
         image = Surface(rect.size)
         if self.bg_color is not None:
             image.fill(self.bg_color)
@@ -34,12 +107,39 @@ class SpriteSheetDataStruct(SpriteSheet):
         n_sprites: int = 1,
         n_lists: int = 1,
         bg_color: str | None = None,
+        cache_size: int = 0,
+        preload: bool = False,
+        subsurface: bool = False,
+        sprite_rects: list[Rect] | None = None,
     ) -> None:
-        super().__init__(spritesheet, bg_color)
+        """Creates new instance of SpriteSheetDataStruct object
+
+        Args:
+            spritesheet (Surface): The sprite sheet image
+            n_sprites (int, optional): Number of sprites per list. Defaults to 1.
+            n_lists (int, optional): Number of lists. Defaults to 1.
+            bg_color (str | None, optional): Color filled behind each segment. Defaults to None.
+            cache_size (int, optional): Most segments kept after extraction. No caching if 0. Defaults to 0.
+            preload (bool, optional): Extract and cache every sprite now. Grows cache_size to fit. Defaults to False.
+            subsurface (bool, optional): Return sprites that share pixels with the sheet instead of copies. Defaults to False.
+            sprite_rects (list[Rect] | None, optional): Explicit sprite rects, for sheets not laid out in a grid. Defaults to None.
+        """
+        super().__init__(spritesheet, bg_color, cache_size, subsurface)
         self.n_lists = n_lists
         self.n_sprites = n_sprites
         self.sprite_size = Rect((0, 0), (self.rect.height, self.rect.width / n_sprites))
-        self.sprite_rects = self._get_sprite_rects()
+        self.sprite_rects = (
+            sprite_rects if sprite_rects is not None else self._get_sprite_rects()
+        )
+
+        if preload:
+            self.preload()
+
+    def preload(self):
+        """Extracts every sprite into the cache, growing cache_size to fit"""
+        self.cache_size = max(self.cache_size, len(self.sprite_rects))
+        for rect in self.sprite_rects:
+            self.get_spritesheet_segment(rect)
 
     def _get_sprite_rects(self) -> list[Rect]:
         return [
@@ -74,8 +174,21 @@ class SpriteSheetMap(SpriteSheetDataStruct):
         n_sprites: int = 1,
         n_lists: int = 1,
         bg_color: str | None = None,
+        cache_size: int = 0,
+        preload: bool = False,
+        subsurface: bool = False,
+        sprite_rects: list[Rect] | None = None,
     ) -> None:
-        super().__init__(spritesheet, n_sprites, n_lists, bg_color)
+        super().__init__(
+            spritesheet,
+            n_sprites,
+            n_lists,
+            bg_color,
+            cache_size,
+            preload,
+            subsurface,
+            sprite_rects,
+        )
         if len(keys) < len(self.sprite_rects):
             raise Exception("Not enough keys for sprites determined")
 
@@ -98,3 +211,112 @@ class SpriteSheetMap(SpriteSheetDataStruct):
             raise KeyError(msg)
 
         return self.get_spritesheet_segment(s)
+
+
+class TransformCache:
+    """Pre-rendered rotations and scales of sprite frames. Angles are snapped to
+    the nearest of angle_buckets evenly spaced angles and scales to the nearest given scale
+    """
+
+    def __init__(
+        self,
+        sprites: SpriteSheetList | SpriteSheetMap,
+        angle_buckets: int = 36,
+        scales: Sequence[float] = (1.0,),
+        max_bytes: int | None = None,
+        preload: bool = False,
+    ) -> None:
+        """Creates new instance of TransformCache object
+
+        Args:
+            sprites (SpriteSheetList | SpriteSheetMap): Source frames. Anything indexable by key works
+            angle_buckets (int, optional): Number of cached angles in a full turn. Defaults to 36.
+            scales (Sequence[float], optional): Cached scales. Defaults to (1.0,).
+            max_bytes (int | None, optional): Pixel memory limit, least recently used variants are evicted first. Unlimited if None. Defaults to None.
+            preload (bool, optional): Render every variant of every sprite in a SpriteSheetList or SpriteSheetMap now. Defaults to False.
+        """
+        if angle_buckets < 1 or not scales:
+            raise ValueError("TransformCache needs at least one angle and scale")
+
+        self.sprites = sprites
+        self.angle_buckets = angle_buckets
+        self.scales = sorted(scales)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[Any, int, float], Surface] = OrderedDict()
+
+        if preload:
+            if isinstance(sprites, SpriteSheetMap):
+                keys = list(sprites.sprite_map)
+            else:
+                keys = list(range(len(sprites.sprite_rects)))
+            self.preload(keys)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: Any, angle: float = 0.0, scale: float = 1.0) -> Surface:
+        """The cached variant of a frame nearest to angle and scale, rendered if missing
+
+        Args:
+            key (Any): Index or key of the frame in sprites
+            angle (float, optional): Counterclockwise rotation in degrees. Defaults to 0.0.
+            scale (float, optional): Scale factor. Defaults to 1.0.
+
+        Returns:
+            Surface: The transformed frame. Shared between calls
+        """
+        step = 360 / self.angle_buckets
+        bucket = round(angle / step) % self.angle_buckets
+        nearest_scale = min(self.scales, key=lambda s: abs(s - scale))
+        cache_key = (key, bucket, nearest_scale)
+
+        image = self._cache.get(cache_key)
+        if image is not None:
+            self.hits += 1
+            self._cache.move_to_end(cache_key)
+            return image
+
+        self.misses += 1
+        image = self.sprites[key]
+        if bucket != 0 or nearest_scale != 1.0:
+            image = pygame.transform.rotozoom(image, bucket * step, nearest_scale)
+
+        self._cache[cache_key] = image
+        self.bytes += self._size(image)
+        self._evict()
+
+        return image
+
+    def preload(self, keys: Sequence[Any]):
+        """Renders every angle and scale of the given frames
+
+        Args:
+            keys (Sequence[Any]): Indexes or keys of frames in sprites
+        """
+        step = 360 / self.angle_buckets
+        for key in keys:
+            for bucket in range(self.angle_buckets):
+                for scale in self.scales:
+                    self.get(key, bucket * step, scale)
+
+    def clear(self):
+        """Drops every cached variant"""
+        self._cache.clear()
+        self.bytes = 0
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+
+        # always keep the newest variant, even if it alone exceeds the limit
+        while self.bytes > self.max_bytes and len(self._cache) > 1:
+            _, image = self._cache.popitem(last=False)
+            self.bytes -= self._size(image)
+
+    @staticmethod
+    def _size(image: Surface) -> int:
+        w, h = image.get_size()
+        return w * h * image.get_bytesize()
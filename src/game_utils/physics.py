@@ -1,10 +1,28 @@
-from numpy.random import normal
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
 from pygame import Vector2, Vector3
 
+from .vector_utils import RandomSource, get_random_source
+
 
 class PhysicsBody:
     """Applies physics to a GameSprite"""
 
+    __slots__ = (
+        "_world",
+        "_index",
+        "_mass",
+        "_velocity",
+        "_position",
+        "_static_friction",
+        "_kinetic_friction",
+        "_elasticity",
+        "_static_friction_mag",
+        "_kinetic_friction_mag",
+    )
+
     ZERO_VECTOR = Vector2(0, 0)
     GRAVITY = 9.8
 
@@ -16,6 +34,7 @@ class PhysicsBody:
         friction: float = 0.0,
         elasticity: float = 0.0,
         slip: float = 1.0,
+        random_source: RandomSource | None = None,
     ):
         """Creates new instance of PhysicsBody object
 
@@ -25,15 +44,113 @@ class PhysicsBody:
             friction (float, optional): Static friction force. Defaults to 0.0.
             elasticity (float, optional): Elasticity is used in caluclating loss of energy. 0 elasticity will have no effect. Defaults to 0.0.
             slip (float, optional): Used in calculating change in static to kinetic friction. Defaults to 1.0.
+            random_source (RandomSource | None, optional): Draws the kinetic friction. The module-wide source if None. Defaults to None.
         """
-        self.mass = mass
-        self.velociy = velocity.copy()
-        self.position = position.copy()
-        self.static_friction = friction
-        self.kinetic_friction = 0
-        self.elasticity = 1 - elasticity
+        self._world: PhysicsWorld | None = None
+        self._index = -1
+        self._mass = mass
+        self._velocity = velocity.copy()
+        self._position = position.copy()
+        self._static_friction = friction
+        self._kinetic_friction = 0
+        self._elasticity = 1 - elasticity
+        self._update_friction()
         if self.static_friction > 0:
-            self.kinetic_friction = self.static_friction * normal(loc=slip)
+            source = random_source or get_random_source()
+            self.kinetic_friction = self.static_friction * float(
+                source.normal(1, loc=slip)[0]
+            )
+
+    @property
+    def world(self) -> "PhysicsWorld | None":
+        """The PhysicsWorld storing this body's state, if any"""
+        return self._world
+
+    @property
+    def index(self) -> int:
+        """This body's row in the world's arrays. -1 if not in a world"""
+        return self._index
+
+    @property
+    def mass(self) -> float:
+        if self._world is not None:
+            return float(self._world._mass[self._index])
+        return self._mass
+
+    @mass.setter
+    def mass(self, value: float):
+        if self._world is not None:
+            self._world._mass[self._index] = value
+        else:
+            self._mass = value
+            self._update_friction()
+
+    @property
+    def velociy(self) -> Vector2:
+        if self._world is not None:
+            return _WorldVector(self, "_velocity")
+        return self._velocity
+
+    @velociy.setter
+    def velociy(self, value: Vector2):
+        if self._world is not None:
+            self._world._velocity[self._index] = value
+        else:
+            self._velocity = value
+
+    @property
+    def position(self) -> Vector2:
+        if self._world is not None:
+            return _WorldVector(self, "_position")
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector2):
+        if self._world is not None:
+            self._world._position[self._index] = value
+        else:
+            self._position = value
+
+    @property
+    def static_friction(self) -> float:
+        if self._world is not None:
+            return float(self._world._static_friction[self._index])
+        return self._static_friction
+
+    @static_friction.setter
+    def static_friction(self, value: float):
+        if self._world is not None:
+            self._world._static_friction[self._index] = value
+        else:
+            self._static_friction = value
+            self._update_friction()
+
+    @property
+    def kinetic_friction(self) -> float:
+        if self._world is not None:
+            return float(self._world._kinetic_friction[self._index])
+        return self._kinetic_friction
+
+    @kinetic_friction.setter
+    def kinetic_friction(self, value: float):
+        if self._world is not None:
+            self._world._kinetic_friction[self._index] = value
+        else:
+            self._kinetic_friction = value
+            self._update_friction()
+
+    @property
+    def elasticity(self) -> float:
+        if self._world is not None:
+            return float(self._world._elasticity[self._index])
+        return self._elasticity
+
+    @elasticity.setter
+    def elasticity(self, value: float):
+        if self._world is not None:
+            self._world._elasticity[self._index] = value
+        else:
+            self._elasticity = value
 
     def force(self, acceleration: Vector2, dtime: float) -> Vector2:
         """Applies an acceleration vector to this body's current velocity with the given change in time.
@@ -60,10 +177,88 @@ class PhysicsBody:
     def move(self, dtime: float) -> Vector2:
         """Returns the position at this moment in time.\n
         Applies velocity over dtime"""
+        if self._world is not None:
+            self._world._position[self._index] += (
+                self._world._velocity[self._index] * dtime
+            )
+            return self.position
+
         self.position += self.velociy * dtime
 
         return self.position.copy()
 
+    def force_inplace(self, acceleration: Vector2, dtime: float):
+        """Same as force, but updates velocity and position in place without
+        creating temporary vectors, and returns nothing
+
+        Args:
+            acceleration (Vector2): The acceleration to apply
+            dtime (float): The change in time
+        """
+        if self._world is not None:
+            self._world_force_inplace(acceleration, dtime)
+            return
+
+        v = self._velocity
+        if v.x != 0 or v.y != 0:
+            friction = self._kinetic_friction_mag
+        else:
+            friction = self._static_friction_mag
+
+        if acceleration.magnitude() * abs(self._mass) > friction:
+            v.x += acceleration.x * dtime
+            v.y += acceleration.y * dtime
+        else:
+            v.x -= v.x * friction * dtime
+            v.y -= v.y * friction * dtime
+
+        self.move_inplace(dtime)
+
+    def move_inplace(self, dtime: float):
+        """Same as move, but updates position in place and returns nothing
+
+        Args:
+            dtime (float): The change in time
+        """
+        if self._world is not None:
+            position = self._world._position[self._index]
+            velocity = self._world._velocity[self._index]
+            position[0] += velocity[0] * dtime
+            position[1] += velocity[1] * dtime
+            return
+
+        p = self._position
+        v = self._velocity
+        p.x += v.x * dtime
+        p.y += v.y * dtime
+
+    def _world_force_inplace(self, acceleration: Vector2, dtime: float):
+        world = self._world
+        assert world is not None
+
+        i = self._index
+        velocity = world._velocity[i]
+        mass = world._mass[i]
+        if velocity[0] != 0 or velocity[1] != 0:
+            friction = abs(world._kinetic_friction[i] * mass * self.GRAVITY)
+        else:
+            friction = abs(world._static_friction[i] * mass * self.GRAVITY)
+
+        if acceleration.magnitude() * abs(mass) > friction:
+            velocity[0] += acceleration.x * dtime
+            velocity[1] += acceleration.y * dtime
+        else:
+            velocity[0] -= velocity[0] * friction * dtime
+            velocity[1] -= velocity[1] * friction * dtime
+
+        self.move_inplace(dtime)
+
+    def _update_friction(self):
+        # friction magnitudes only depend on mass and whether the body is moving
+        normal = self._mass * self.GRAVITY
+        self._static_friction_mag = abs(self._static_friction * normal)
+        self._kinetic_friction_mag = abs(self._kinetic_friction * normal)
+
     def on_collide(self, other):
         """New velocity is given by V`= (V(m-s) + U2s)/(m+s)
         for initial magnitudes Vm(self) and Us(other).  Calculates loss of
@@ -111,3 +306,349 @@ class PhysicsBody:
 
     def __str__(self) -> str:
         return str(self.position)
+
+
+class _WorldVector(Vector2):
+    """Position or velocity of a body in a PhysicsWorld. A copy of the world's row, but
+    changes made to it in place, e.g. body.velociy.x = 0, are written back to the world
+    """
+
+    __slots__ = ("_body", "_array")
+
+    def __init__(self, body: PhysicsBody, array: str):
+        world = body._world
+        assert world is not None
+
+        super().__init__(*getattr(world, array)[body._index])
+        self._array = array
+        self._body = body
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._write_back()
+
+    def _write_back(self):
+        # results of arithmetic on this vector are _WorldVectors too, without a body
+        body = getattr(self, "_body", None)
+        if body is not None and body._world is not None:
+            getattr(body._world, self._array)[body._index] = self
+
+
+def _writes_back(name: str) -> Callable[..., Any]:
+    method = getattr(Vector2, name)
+
+    def wrapper(self: _WorldVector, *args: Any) -> Any:
+        result = method(self, *args)
+        self._write_back()
+        return result
+
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__iadd__",
+    "__isub__",
+    "__imul__",
+    "__itruediv__",
+    "__ifloordiv__",
+    "update",
+    "scale_to_length",
+    "normalize_ip",
+    "rotate_ip",
+    "rotate_ip_rad",
+    "rotate_rad_ip",
+    "reflect_ip",
+    "clamp_magnitude_ip",
+    "move_towards_ip",
+):
+    setattr(_WorldVector, _name, _writes_back(_name))
+
+
+class PhysicsWorld:
+    """Stores the state of many PhysicsBody objects in NumPy arrays so forces,
+    friction and movement are applied to every body with one batched call.
+    Bodies added to the world become handles into the world's arrays
+    """
+
+    def __init__(
+        self,
+        *bodies: PhysicsBody,
+        capacity: int = 64,
+        seed: int | None = None,
+    ):
+        """Creates new instance of PhysicsWorld object
+
+        Args:
+            *bodies (PhysicsBody): Any bodies to add to the world
+            capacity (int, optional): Initial number of rows allocated. Grows as needed. Defaults to 64.
+            seed (int | None, optional): Seeds random_source, for reproducible simulations. Defaults to None.
+        """
+        self.random_source = RandomSource(seed)
+        self._count = 0
+        self._bodies: list[PhysicsBody] = []
+        self._allocate(max(capacity, 1))
+
+        for body in bodies:
+            self.add(body)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return iter(self._bodies)
+
+    @property
+    def masses(self) -> np.ndarray:
+        """Live (n,) view of body masses"""
+        return self._mass[: self._count]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Live (n, 2) view of body positions"""
+        return self._position[: self._count]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Live (n, 2) view of body velocities"""
+        return self._velocity[: self._count]
+
+    @property
+    def elasticities(self) -> np.ndarray:
+        """Live (n,) view of body elasticities"""
+        return self._elasticity[: self._count]
+
+    def add(self, body: PhysicsBody) -> PhysicsBody:
+        """Copies the state of body into the world and binds body as a handle to it
+
+        Args:
+            body (PhysicsBody): The body to add. Must not belong to another world
+
+        Returns:
+            PhysicsBody: The given body
+        """
+        if body.world is self:
+            return body
+        if body.world is not None:
+            raise ValueError("PhysicsBody already belongs to another PhysicsWorld")
+
+        if self._count == len(self._mass):
+            self._allocate(len(self._mass) * 2)
+
+        i = self._count
+        self._mass[i] = body.mass
+        self._position[i] = body.position
+        self._velocity[i] = body.velociy
+        self._static_friction[i] = body.static_friction
+        self._kinetic_friction[i] = body.kinetic_friction
+        self._elasticity[i] = body.elasticity
+
+        body._world = self
+        body._index = i
+        self._bodies.append(body)
+        self._count += 1
+
+        return body
+
+    def create(self, **kwargs) -> PhysicsBody:
+        """Creates a new PhysicsBody in this world, drawing from the world's random_source
+
+        Args:
+            **kwargs: Arguments passed to PhysicsBody
+
+        Returns:
+            PhysicsBody: The new body handle
+        """
+        kwargs.setdefault("random_source", self.random_source)
+        return self.add(PhysicsBody(**kwargs))
+
+    def remove(self, body: PhysicsBody):
+        """Removes body from the world. The body keeps its current state
+
+        Args:
+            body (PhysicsBody): The body to remove
+        """
+        if body.world is not self:
+            raise ValueError("PhysicsBody does not belong to this PhysicsWorld")
+
+        i = body.index
+        position = body.position
+        velocity = body.velociy
+        state = (
+            body.mass,
+            body.static_friction,
+            body.kinetic_friction,
+            body.elasticity,
+        )
+
+        last = self._count - 1
+        if i != last:
+            for array in self._arrays():
+                array[i] = array[last]
+            moved = self._bodies[last]
+            moved._index = i
+            self._bodies[i] = moved
+        self._bodies.pop()
+        self._count -= 1
+
+        body._world = None
+        body._index = -1
+        # in place, so vectors shared with the body before it was added follow it again
+        body._position.update(position)
+        body._velocity.update(velocity)
+        (
+            body.mass,
+            body.static_friction,
+            body.kinetic_friction,
+            body.elasticity,
+        ) = state
+
+    def force(self, acceleration: np.ndarray | Vector2, dtime: float):
+        """Applies acceleration to every body, same as PhysicsBody.force.
+        Bodies whose force does not overcome friction are slowed by friction instead
+
+        Args:
+            acceleration (np.ndarray | Vector2): Shape (2,) applied to all bodies, or (n, 2) one per body
+            dtime (float): The change in time
+        """
+        n = self._count
+        apply_force(
+            self._position[:n],
+            self._velocity[:n],
+            self._mass[:n],
+            self._static_friction[:n],
+            self._kinetic_friction[:n],
+            acceleration,
+            dtime,
+        )
+
+    def move(self, dtime: float):
+        """Applies velocity over dtime to every body, same as PhysicsBody.move
+
+        Args:
+            dtime (float): The change in time
+        """
+        n = self._count
+        self._position[:n] += self._velocity[:n] * dtime
+
+    def collide(self, pairs: np.ndarray):
+        """Resolves every contact pair at once, same as calling a.on_collide(b)
+        then b.on_collide(a) for each pair (a, b) in order
+
+        Args:
+            pairs (np.ndarray): Shape (k, 2) of body indices. See PhysicsBody.index
+
+        Raises:
+            IndexError: An index is negative or not below len(self)
+        """
+        pairs = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)
+        if len(pairs) == 0:
+            return
+
+        if pairs.min() < 0 or pairs.max() >= self._count:
+            msg = f"pair index out of bounds for {self._count} bodies"
+            raise IndexError(msg)
+
+        if len(np.unique(pairs)) == pairs.size:
+            self._collide(pairs)
+            return
+
+        # a body in several pairs sees the result of its earlier pairs,
+        # so split pairs into rounds where every body appears at most once
+        rounds = np.empty(len(pairs), dtype=np.intp)
+        last_round: dict[int, int] = {}
+        for k, (a, b) in enumerate(pairs.tolist()):
+            r = max(last_round.get(a, -1), last_round.get(b, -1)) + 1
+            last_round[a] = last_round[b] = rounds[k] = r
+
+        for r in range(rounds.max() + 1):
+            self._collide(pairs[rounds == r])
+
+    def _collide(self, pairs: np.ndarray):
+        a, b = pairs[:, 0], pairs[:, 1]
+        ma = self._mass[a][:, None]
+        mb = self._mass[b][:, None]
+        va = self._velocity[a]
+        vb = self._velocity[b]
+        total = ma + mb
+
+        va = (va * (ma - mb) + vb * 2 * mb) / total * self._elasticity[a][:, None]
+        vb = (vb * (mb - ma) + va * 2 * ma) / total * self._elasticity[b][:, None]
+
+        self._velocity[a] = va
+        self._velocity[b] = vb
+
+    def _arrays(self) -> tuple[np.ndarray, ...]:
+        return (
+            self._mass,
+            self._position,
+            self._velocity,
+            self._static_friction,
+            self._kinetic_friction,
+            self._elasticity,
+        )
+
+    def _allocate(self, capacity: int):
+        n = self._count
+        mass = np.zeros(capacity)
+        position = np.zeros((capacity, 2))
+        velocity = np.zeros((capacity, 2))
+        static_friction = np.zeros(capacity)
+        kinetic_friction = np.zeros(capacity)
+        elasticity = np.ones(capacity)
+
+        if n > 0:
+            mass[:n] = self._mass[:n]
+            position[:n] = self._position[:n]
+            velocity[:n] = self._velocity[:n]
+            static_friction[:n] = self._static_friction[:n]
+            kinetic_friction[:n] = self._kinetic_friction[:n]
+            elasticity[:n] = self._elasticity[:n]
+
+        self._mass = mass
+        self._position = position
+        self._velocity = velocity
+        self._static_friction = static_friction
+        self._kinetic_friction = kinetic_friction
+        self._elasticity = elasticity
+
+
+def apply_force(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    masses: np.ndarray,
+    static_friction: np.ndarray,
+    kinetic_friction: np.ndarray,
+    acceleration: np.ndarray | Vector2,
+    dtime: float,
+):
+    """Applies acceleration and friction to arrays of bodies in place, same as PhysicsBody.force.
+    Used by PhysicsWorld and by the ECS physics system
+
+    Args:
+        positions (np.ndarray): Shape (n, 2) positions, moved in place
+        velocities (np.ndarray): Shape (n, 2) velocities, updated in place
+        masses (np.ndarray): Shape (n,) masses
+        static_friction (np.ndarray): Shape (n,) static friction coefficients
+        kinetic_friction (np.ndarray): Shape (n,) kinetic friction coefficients
+        acceleration (np.ndarray | Vector2): Shape (2,) applied to all bodies, or (n, 2) one per body
+        dtime (float): The change in time
+    """
+    n = len(positions)
+    accel = np.broadcast_to(np.asarray(acceleration, dtype=float), (n, 2))
+
+    moving = np.any(velocities != 0, axis=1)
+    friction = np.abs(
+        np.where(moving, kinetic_friction, static_friction)
+        * masses
+        * PhysicsBody.GRAVITY
+    )
+    force = np.hypot(accel[:, 0], accel[:, 1]) * np.abs(masses)
+
+    velocities += np.where(
+        (force > friction)[:, None],
+        accel * dtime,
+        -velocities * friction[:, None] * dtime,
+    )
+    positions += velocities * dtime
@@ -0,0 +1,284 @@
+from collections.abc import Callable
+from typing import Generic, TypedDict, TypeVar
+
+from pygame import Vector2
+from pygame.sprite import Group, Sprite
+
+from .physics import PhysicsBody
+from .sprites import GameSprite, PhysicsSprite
+
+T = TypeVar("T")
+S = TypeVar("S", bound=GameSprite)
+
+
+class PoolStats(TypedDict):
+    """Utilization of an ObjectPool
+
+    Args:
+        size (int): Objects owned by the pool, active or free
+        active (int): Objects acquired and not yet released
+        peak (int): Most objects active at once
+        created (int): Objects created after preallocation because the pool was empty
+        acquired (int): Total acquire() calls
+        released (int): Total release() calls
+        utilization (float): active / size
+    """
+
+    size: int
+    active: int
+    peak: int
+    created: int
+    acquired: int
+    released: int
+    utilization: float
+
+
+class ObjectPool(Generic[T]):
+    """Preallocates objects and recycles them through acquire() and release(),
+    so spawning and despawning doesn't allocate or leave garbage mid game
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        size: int = 0,
+        reset: Callable[[T], None] | None = None,
+        max_size: int | None = None,
+    ):
+        """Creates new instance of ObjectPool object
+
+        Args:
+            factory (Callable[[], T]): Creates a new object
+            size (int, optional): Objects created up front. Defaults to 0.
+            reset (Callable[[T], None] | None, optional): Restores an object's initial state, called on release. Defaults to None.
+            max_size (int | None, optional): Most objects the pool will own. acquire() raises when reached. Unbounded if None. Defaults to None.
+        """
+        self.factory = factory
+        self.reset = reset
+        self.max_size = max_size
+        self._free: list[T] = []
+        # acquired objects by id, so unhashable objects can be pooled
+        self._in_use: dict[int, T] = {}
+        self._size = 0
+        self._peak = 0
+        self._created = 0
+        self._acquired = 0
+        self._released = 0
+
+        self.reserve(size)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def active(self) -> int:
+        """Objects acquired and not yet released"""
+        return len(self._in_use)
+
+    @property
+    def free(self) -> int:
+        """Objects ready to be acquired without creating new ones"""
+        return len(self._free)
+
+    def reserve(self, size: int):
+        """Creates objects until the pool owns at least size
+
+        Args:
+            size (int): The number of objects
+        """
+        if self.max_size is not None:
+            size = min(size, self.max_size)
+
+        while self._size < size:
+            self._free.append(self._create())
+
+    def acquire(self) -> T:
+        """A free object, or a new one if none are free
+
+        Raises:
+            RuntimeError: The pool owns max_size objects and all are active
+
+        Returns:
+            T: The object
+        """
+        if self._free:
+            obj = self._free.pop()
+        elif self.max_size is not None and self._size >= self.max_size:
+            raise RuntimeError("ObjectPool exhausted")
+        else:
+            obj = self._create()
+            self._created += 1
+
+        self._in_use[id(obj)] = obj
+        self._acquired += 1
+        self._peak = max(self._peak, len(self._in_use))
+
+        return obj
+
+    def release(self, obj: T):
+        """Resets obj and returns it to the pool
+
+        Args:
+            obj (T): An object acquired from this pool
+
+        Raises:
+            ValueError: obj is not acquired from this pool, or was already released
+        """
+        if self._in_use.pop(id(obj), None) is not obj:
+            raise ValueError("Object not acquired from this ObjectPool")
+
+        if self.reset is not None:
+            self.reset(obj)
+
+        self._free.append(obj)
+        self._released += 1
+
+    def stats(self) -> PoolStats:
+        """Current utilization
+
+        Returns:
+            PoolStats: Pool counters
+        """
+        return {
+            "size": self._size,
+            "active": self.active,
+            "peak": self._peak,
+            "created": self._created,
+            "acquired": self._acquired,
+            "released": self._released,
+            "utilization": self.active / self._size if self._size else 0.0,
+        }
+
+    def _create(self) -> T:
+        self._size += 1
+        return self.factory()
+
+
+class ActiveGroup(Group):
+    """Sprite group that keeps inactive sprites registered but skips them.
+    sprites(), and so iteration, len(), update() and draw(), only see active sprites
+    """
+
+    def __init__(self, *sprites):
+        self._active: dict[Sprite, None] = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if getattr(sprite, "active", True):
+            self._active[sprite] = None
+
+    def remove_internal(self, sprite: Sprite):
+        super().remove_internal(sprite)
+        self._active.pop(sprite, None)
+
+    def set_active(self, sprite: Sprite, active: bool):
+        """Includes or skips a registered sprite
+
+        Args:
+            sprite (Sprite): A sprite in this group
+            active (bool): Whether the group includes it
+        """
+        if active:
+            if sprite in self.spritedict:
+                self._active[sprite] = None
+        else:
+            self._active.pop(sprite, None)
+
+    def sprites(self) -> list:
+        return list(self._active)
+
+    def empty(self):
+        super().empty()
+        self._active.clear()
+
+
+class SpritePool(ObjectPool[S]):
+    """ObjectPool of sprites that stay registered in their groups while free.
+    Acquiring sets the sprite's active flag, releasing clears it, and ActiveGroups
+    skip inactive sprites, so no group add or remove happens per spawn
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], S],
+        *groups: ActiveGroup,
+        size: int = 0,
+        max_size: int | None = None,
+    ):
+        """Creates new instance of SpritePool object
+
+        Args:
+            factory (Callable[[], S]): Creates a new sprite, with its PhysicsBody if any
+            *groups (ActiveGroup): Groups every pooled sprite is registered in
+            size (int, optional): Sprites created up front. Defaults to 0.
+            max_size (int | None, optional): Most sprites the pool will own. Unbounded if None. Defaults to None.
+        """
+        self.groups = groups
+        super().__init__(factory, size, reset_sprite, max_size)
+
+    def acquire(
+        self, position: Vector2 | None = None, velocity: Vector2 | None = None
+    ) -> S:
+        """A free sprite, activated and moved to position
+
+        Args:
+            position (Vector2 | None, optional): Where to spawn the sprite. Where it was released if None. Defaults to None.
+            velocity (Vector2 | None, optional): Initial PhysicsBody velocity. (0, 0) if None. Defaults to None.
+
+        Returns:
+            S: The sprite
+        """
+        sprite = super().acquire()
+        if position is not None:
+            sprite.position.update(position)
+            w, h = sprite.rect.size
+            sprite.rect.topleft = (int(position.x - w / 2), int(position.y - h / 2))
+            sprite.notify_moved()
+        if isinstance(sprite, PhysicsSprite):
+            # a free sprite's body is still simulated if it is in a PhysicsWorld
+            body = sprite.physics_body
+            body.position = sprite.position
+            body.velociy = Vector2(velocity) if velocity is not None else Vector2()
+
+        self._set_active(sprite, True)
+        return sprite
+
+    def release(self, obj: S):
+        super().release(obj)
+        self._set_active(obj, False)
+
+    def _create(self) -> S:
+        sprite = super()._create()
+        sprite.active = False
+        for group in self.groups:
+            group.add(sprite)
+
+        return sprite
+
+    @staticmethod
+    def _set_active(sprite: GameSprite, active: bool):
+        sprite.active = active
+        for group in sprite.groups():
+            if isinstance(group, ActiveGroup):
+                group.set_active(sprite, active)
+
+
+def reset_sprite(sprite: GameSprite):
+    """Default SpritePool reset. Stops the sprite's PhysicsBody, if any
+
+    Args:
+        sprite (GameSprite): The released sprite
+    """
+    if isinstance(sprite, PhysicsSprite):
+        sprite.physics_body.velociy = Vector2()
+
+
+def reset_body(body: PhysicsBody):
+    """ObjectPool reset for PhysicsBody objects. Moves the body to (0, 0) and stops it
+
+    Args:
+        body (PhysicsBody): The released body
+    """
+    body.position = Vector2()
+    body.velociy = Vector2()
@@ -0,0 +1,407 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from collections.abc import Callable, Sequence
+from types import CodeType, FrameType, FunctionType
+from typing import Any, TypedDict
+
+import numpy as np
+import pygame.font
+from pygame import Rect, Surface
+
+FrameListener = Callable[[dict[str, float]], None]
+
+
+class AllocationStats(TypedDict):
+    """Allocations attributed to one function in one frame. Includes the functions it calls
+
+    Args:
+        calls (int): Calls that returned during the frame
+        count (int): Change in live memory blocks from entry to return, summed over calls. How many allocations the calls left alive
+        size (int): Bytes allocated, summed over calls. Each call counts its most bytes allocated at once, above the memory at entry, so temporaries freed before returning are included
+        net (int): Change in live bytes from entry to return, summed over calls. What the calls left allocated, including returned objects
+    """
+
+    calls: int
+    count: int
+    size: int
+    net: int
+
+
+class AllocationReport(TypedDict):
+    """Allocations made during one frame
+
+    Args:
+        peak (int): Most bytes allocated at once during the frame, above the frame's starting memory. Includes temporaries freed before the frame ended
+        functions (dict[str, AllocationStats]): Allocations by "module.function" in the tracked modules
+    """
+
+    peak: int
+    functions: dict[str, AllocationStats]
+
+
+class FrameProfiler:
+    """Times each phase of the game loop. Game.run records a phase with lap() and
+    ends every loop with end_frame(). Keeps a rolling window of samples per phase
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window: int = 300, overlay: bool = False):
+        """Creates new instance of FrameProfiler object
+
+        Args:
+            window (int, optional): Number of frames kept for percentiles. Defaults to 300.
+            overlay (bool, optional): Draw phase percentiles on screen each frame. Defaults to False.
+        """
+        self.window = window
+        self.overlay = overlay
+        self.samples: dict[str, deque[float]] = {}
+        self.frame: dict[str, float] = {}
+        self._listeners: list[FrameListener] = []
+        self._font: pygame.font.Font | None = None
+
+    def add_listener(self, listener: FrameListener):
+        """Registers a callback invoked at the end of every frame, e.g. to export metrics
+
+        Args:
+            listener (FrameListener): Called with seconds spent in each phase this frame, and the "frame" total
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: FrameListener):
+        self._listeners.remove(listener)
+
+    def lap(self, phase: str, start: float) -> float:
+        """Records the time since start as phase
+
+        Args:
+            phase (str): The phase name
+            start (float): A time.perf_counter() value, e.g. the last lap's return value
+
+        Returns:
+            float: The current time.perf_counter(), the start of the next phase
+        """
+        now = time.perf_counter()
+        self.frame[phase] = self.frame.get(phase, 0.0) + now - start
+        return now
+
+    def end_frame(self):
+        """Stores this frame's phase times and notifies listeners"""
+        frame = self.frame
+        frame["frame"] = sum(frame.values())
+
+        for phase, seconds in frame.items():
+            samples = self.samples.get(phase)
+            if samples is None:
+                samples = self.samples[phase] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+        for listener in self._listeners:
+            listener(frame)
+
+        self.frame = {}
+
+    def percentiles(self, phase: str) -> dict[str, float]:
+        """Rolling percentiles of a phase
+
+        Args:
+            phase (str): The phase name, or "frame" for whole frames
+
+        Returns:
+            dict[str, float]: Seconds at p50, p95 and p99. Empty if the phase has no samples
+        """
+        samples = self.samples.get(phase)
+        if not samples:
+            return {}
+
+        values = np.percentile(np.fromiter(samples, float), self.PERCENTILES)
+        return {f"p{p}": float(v) for p, v in zip(self.PERCENTILES, values)}
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Rolling percentiles of every phase
+
+        Returns:
+            dict[str, dict[str, float]]: percentiles() by phase name
+        """
+        return {phase: self.percentiles(phase) for phase in self.samples}
+
+    def draw_overlay(
+        self, surface: Surface, position: tuple[int, int] = (8, 8)
+    ) -> Rect:
+        """Draws a table of phase percentiles in milliseconds
+
+        Args:
+            surface (Surface): Where to draw
+            position (tuple[int, int], optional): Top left of the table. Defaults to (8, 8).
+
+        Returns:
+            Rect: The region drawn
+        """
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.Font(None, 18)
+
+        lines = [
+            self._font.render(
+                f"{phase:<14}"
+                + " ".join(f"{k} {v * 1000:6.2f}" for k, v in p.items())
+                + " ms",
+                True,
+                "white",
+                "black",
+            )
+            for phase, p in self.summary().items()
+        ]
+
+        x, y = position
+        rects = []
+        for line in lines:
+            rects.append(surface.blit(line, (x, y)))
+            y += line.get_height()
+
+        return Rect(x, position[1], 0, 0).unionall(rects) if rects else Rect(x, y, 0, 0)
+
+
+class AllocationTracker:
+    """Diagnostics mode built on tracemalloc. Game.run calls start(), end_frame() once per loop
+    and stop(). Each frame is reported as the peak bytes allocated and the allocations made by
+    each function in the tracked game_utils modules, read from a sys.setprofile hook on every
+    call and return. Tracing slows the game down considerably
+    """
+
+    def __init__(
+        self,
+        modules: Sequence[str] = ("physics", "sprites", "vector_utils"),
+        window: int = 300,
+    ):
+        """Creates new instance of AllocationTracker object
+
+        Args:
+            modules (Sequence[str], optional): game_utils module names to attribute allocations to. Defaults to ("physics", "sprites", "vector_utils").
+            window (int, optional): Number of frame reports kept. Defaults to 300.
+        """
+        self.modules = modules
+        self.reports: deque[AllocationReport] = deque(maxlen=window)
+        self._files = {f"{m}.py" for m in modules}
+        # calls, count, size and net of this frame, by code object and by name. Arrays
+        # are updated in place so the hook doesn't allocate inside measured calls
+        self._stats: dict[CodeType, array[int]] = {}
+        self._functions: dict[str, array[int]] = {}
+        # of the frame at depth 0 then each active call: memory at entry, highest memory
+        # seen, memory at the last peak reset after a returning call, blocks at entry and
+        # size of the frame object the profile hook created. Preallocated, as above
+        self._starts = array("q", [0]) * 64
+        self._highs = array("q", [0]) * 64
+        self._floors = array("q", [0]) * 64
+        self._blocks = array("q", [0]) * 64
+        self._frames = array("q", [0]) * 64
+        self._depth = 0
+        self._previous_profile: Callable[..., Any] | None = None
+        self._started_tracing = False
+        self._running = False
+
+    def start(self):
+        """Starts tracing, if not already, installs the profile hook and begins the first frame"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self._register()
+        self._previous_profile = sys.getprofile()
+        self._begin_frame()
+        self._running = True
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        """Removes the profile hook, and stops tracing if start() started it"""
+        if self._running:
+            sys.setprofile(self._previous_profile)
+            self._previous_profile = None
+            self._running = False
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def end_frame(self) -> AllocationReport:
+        """Reports allocations since the last frame and begins the next
+
+        Returns:
+            AllocationReport: This frame's report, also appended to reports
+        """
+        assert self._running, "AllocationTracker.start() not called"
+
+        current, peak = tracemalloc.get_traced_memory()
+        high = max(self._highs[0], current)
+        if peak > high and peak > self._floors[0]:
+            high = peak
+
+        functions: dict[str, AllocationStats] = {}
+        for name, stats in self._functions.items():
+            if stats[0]:
+                calls, count, size, net = stats
+                functions[name] = {
+                    "calls": calls,
+                    "count": count,
+                    "size": size,
+                    "net": net,
+                }
+                stats[0] = stats[1] = stats[2] = stats[3] = 0
+
+        report: AllocationReport = {
+            "peak": high - self._starts[0],
+            "functions": functions,
+        }
+        self.reports.append(report)
+        self._begin_frame()
+
+        return report
+
+    def summary(self) -> dict[str, AllocationStats]:
+        """Mean allocations per frame over the kept reports, by function
+
+        Returns:
+            dict[str, AllocationStats]: Mean calls, count, size and net, rounded, by "module.function"
+        """
+        totals: dict[str, AllocationStats] = {}
+        for report in self.reports:
+            for name, stats in report["functions"].items():
+                total = totals.setdefault(
+                    name, {"calls": 0, "count": 0, "size": 0, "net": 0}
+                )
+                total["calls"] += stats["calls"]
+                total["count"] += stats["count"]
+                total["size"] += stats["size"]
+                total["net"] += stats["net"]
+
+        n = max(len(self.reports), 1)
+        return {
+            name: {
+                "calls": round(t["calls"] / n),
+                "count": round(t["count"] / n),
+                "size": round(t["size"] / n),
+                "net": round(t["net"] / n),
+            }
+            for name, t in totals.items()
+        }
+
+    def _begin_frame(self):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        self._starts[0] = self._highs[0] = current
+        self._floors[0] = 0
+        self._depth = 0
+
+    def _register(self):
+        # every function of the tracked modules, so the hook never allocates to add one
+        self._stats = {}
+        self._functions = {}
+        for obj in gc.get_objects():
+            if isinstance(obj, FunctionType):
+                self._register_code(obj.__code__)
+
+    def _register_code(self, code: CodeType):
+        if code in self._stats:
+            return
+
+        name = self._function_name(code)
+        if name is None:
+            return
+
+        stats = self._functions.get(name)
+        if stats is None:
+            stats = self._functions[name] = array("q", [0, 0, 0, 0])
+        self._stats[code] = stats
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                self._register_code(const)
+
+    def _profile(self, frame: FrameType, event: str, arg: Any):
+        if event != "call" and event != "return":
+            return
+
+        stats = self._stats.get(frame.f_code)
+        if event == "call":
+            # untracked calls are followed inside tracked ones, for the frame objects below
+            if stats is None and self._depth == 0:
+                return
+            self._call(frame)
+        elif self._depth == 0:
+            # called before this frame began, or untracked
+            return
+        else:
+            self._return(stats)
+
+        # the hook's own temporaries are freed by now, keep them out of the next peak
+        tracemalloc.reset_peak()
+
+    def _call(self, frame: FrameType):
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        # the frame object is created for the hook, not allocated by the code measured
+        frame_size = sys.getsizeof(frame)
+        depth = self._depth
+        highs = self._highs
+
+        # the caller's high water mark, before this call's frame object. A peak no higher
+        # than the last reset is the hook's own
+        if peak > current and peak > self._floors[depth]:
+            high = peak
+        else:
+            high = current - frame_size
+        if high > highs[depth]:
+            highs[depth] = high
+
+        depth += 1
+        if depth == len(highs):
+            for stack in (
+                self._starts,
+                highs,
+                self._floors,
+                self._blocks,
+                self._frames,
+            ):
+                stack.extend(stack)
+        self._starts[depth] = highs[depth] = current
+        self._floors[depth] = 0
+        self._blocks[depth] = blocks
+        self._frames[depth] = frame_size
+        self._depth = depth
+
+    def _return(self, stats: "array[int] | None"):
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        depth = self._depth
+        highs = self._highs
+
+        high = max(highs[depth], current)
+        if peak > high and peak > self._floors[depth]:
+            high = peak
+        start = self._starts[depth]
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += blocks - self._blocks[depth]
+            stats[2] += high - start
+            stats[3] += current - start
+
+        # the caller sees this call without its frame object, and the reset that
+        # follows leaves the peak at the current memory, frame object included
+        high -= self._frames[depth]
+        depth -= 1
+        if high > highs[depth]:
+            highs[depth] = high
+        self._floors[depth] = current
+        self._depth = depth
+
+    def _function_name(self, code: CodeType) -> str | None:
+        directory, filename = os.path.split(code.co_filename)
+        if filename not in self._files or os.path.basename(directory) != "game_utils":
+            return None
+
+        return f"{os.path.splitext(filename)[0]}.{code.co_qualname}"
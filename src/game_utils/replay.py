@@ -0,0 +1,166 @@
+import struct
+from collections.abc import Sequence
+from typing import BinaryIO
+
+from pygame import Vector2
+
+from .controller import Controller, VectorAction
+
+MAGIC = b"GURP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBH")
+_NAME_LENGTH = struct.Struct("<H")
+
+
+def _frame_struct(n_actions: int) -> struct.Struct:
+    # dt, direction x, direction y, one value per action
+    return struct.Struct(f"<{3 + n_actions}d")
+
+
+class InputRecorder:
+    """Streams what a controller returns each update, and the delta time, to a binary file.
+    Play it back with ReplayController. Pass to Game as recorder to record every update
+    """
+
+    def __init__(
+        self,
+        file: str | BinaryIO,
+        controller: Controller,
+        action_names: Sequence[str] | None = None,
+    ):
+        """Creates new instance of InputRecorder object and writes the file header
+
+        Args:
+            file (str | BinaryIO): Path or binary file to write
+            controller (Controller): The controller to record
+            action_names (Sequence[str] | None, optional): Actions to record. Every action of the controller if None. Defaults to None.
+        """
+        self.controller = controller
+        self.action_names = list(
+            action_names if action_names is not None else controller.actions
+        )
+        self.frames = 0
+        self._owns_file = isinstance(file, str)
+        self._file: BinaryIO = open(file, "wb") if isinstance(file, str) else file
+        self._frame = _frame_struct(len(self.action_names))
+
+        self._file.write(_HEADER.pack(MAGIC, VERSION, len(self.action_names)))
+        for name in self.action_names:
+            encoded = name.encode()
+            self._file.write(_NAME_LENGTH.pack(len(encoded)))
+            self._file.write(encoded)
+
+    def record(self, dt: float):
+        """Writes one frame: dt, the controller's direction and every recorded action.
+        The direction is (0, 0) for controllers that don't implement direction()
+
+        Args:
+            dt (float): The delta time of this update
+        """
+        try:
+            direction = self.controller.direction()
+        except NotImplementedError:
+            # base JoystickController and KeyboardController only implement actions
+            direction = Vector2()
+        self._file.write(
+            self._frame.pack(
+                dt,
+                direction.x,
+                direction.y,
+                *(self.controller.action(name) for name in self.action_names),
+            )
+        )
+        self.frames += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        """Flushes, and closes the file if it was opened from a path"""
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "InputRecorder":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ReplayController(Controller):
+    """Controller driven by a file written by InputRecorder. Use it in place of the
+    recorded controller and pass it to Game as replay, so every update gets the recorded
+    dt and input. Runs the same session deterministically, e.g. headless and uncapped
+    """
+
+    def __init__(self, file: str | BinaryIO):
+        """Creates new instance of ReplayController object and reads the file header.
+        Directions are replayed as recorded, so speed is always 1
+
+        Args:
+            file (str | BinaryIO): Path or binary file written by InputRecorder
+        """
+        self._owns_file = isinstance(file, str)
+        self._file: BinaryIO = open(file, "rb") if isinstance(file, str) else file
+
+        magic, version, n_actions = _HEADER.unpack(self._file.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not an InputRecorder file")
+
+        names = []
+        for _ in range(n_actions):
+            (length,) = _NAME_LENGTH.unpack(self._file.read(_NAME_LENGTH.size))
+            names.append(self._file.read(length).decode())
+
+        super().__init__(
+            1.0,
+            *(
+                VectorAction(input_id=i, action_type="button", action_name=name)
+                for i, name in enumerate(names)
+            ),
+        )
+        self.frame = 0
+        self.dt = 0.0
+        self._frame = _frame_struct(n_actions)
+        self._direction = Vector2()
+        self._values: tuple[float, ...] = (0.0,) * n_actions
+
+    def advance(self) -> float | None:
+        """Reads the next frame. Called by Game before every update
+
+        Returns:
+            float | None: The recorded dt, or None when the recording has ended
+        """
+        data = self._file.read(self._frame.size)
+        if len(data) < self._frame.size:
+            return None
+
+        self.dt, x, y, *values = self._frame.unpack(data)
+        self._direction.update(x, y)
+        self._values = tuple(values)
+        self.frame += 1
+
+        return self.dt
+
+    def direction(self) -> Vector2:
+        return self._direction.copy()
+
+    def action(self, key: str) -> float:
+        vector_action = self.actions.get(key)
+
+        if vector_action is not None:
+            return self._values[vector_action["input_id"]]
+
+        return 0.0
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "ReplayController":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,10 +1,16 @@
 from abc import abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Any
 
 import pygame.display as display
-from pygame import FULLSCREEN, Color, Surface
+from pygame import FULLSCREEN, Color, Rect, Surface
+from pygame.sprite import Sprite
 from pygame.time import Clock
 
+from .camera import Camera
+
 ColorType = str | tuple[int, int, int] | Color
+StaticDrawable = Callable[[Surface], Any]
 
 
 class ScreenSettings:
@@ -18,14 +24,41 @@ class ScreenSettings:
         frames_per_second: int = 60,
         bg_color: ColorType | None = None,
         bg_image: Surface | None = None,
+        headless: bool = False,
+        dirty_rects: bool = False,
+        camera: Camera | None = None,
     ):
+        """Creates new instance of ScreenSettings object
+
+        Args:
+            width (float, optional): Screen width. Fullscreen if width and height are 0. Defaults to 0.0.
+            height (float, optional): Screen height. Defaults to 0.0.
+            frames_per_second (int, optional): Frame rate cap. In headless mode, the synthetic frame rate. Defaults to 60.
+            bg_color (ColorType | None, optional): Background color. Defaults to None.
+            bg_image (Surface | None, optional): Background image. Defaults to None.
+            headless (bool, optional): Draw to an offscreen Surface instead of a display, and run uncapped with a synthetic delta time. Defaults to False.
+            dirty_rects (bool, optional): Only erase and push regions passed to mark_dirty, instead of the whole screen. Defaults to False.
+            camera (Camera | None, optional): Viewport draw_sprites draws through. Sprite rects are screen coordinates if None. Defaults to None.
+        """
+        self.headless = headless
+        self.dirty_rects = dirty_rects
+        self.camera = camera
+        self._dirty: list[Rect] = []
+        self._last_dirty: list[Rect] = []
+        self._full_redraw = True
+        self._background: Surface | None = None
+        self._static_drawables: list[StaticDrawable] = []
         self.clock = Clock()
         self.bg_image = bg_image
         self.bg_color = bg_color
         self.frames_per_second = frames_per_second
+        # fraction of a fixed timestep left over, set by Game. Use to interpolate drawing
+        self.alpha = 1.0
         self.width = width
         self.height = height
-        if self.width == 0.0 and self.height == 0.0:
+        if self.headless:
+            self.screen = Surface((self.width, self.height))
+        elif self.width == 0.0 and self.height == 0.0:
             self.screen = display.set_mode((0, 0), FULLSCREEN)
             self.width = self.screen.get_width()
             self.height = self.screen.get_height()
@@ -36,11 +69,158 @@ class ScreenSettings:
         """resizes to fullscreen by default"""
         self.width = width
         self.height = height
-        self.screen = display.set_mode((self.width, self.height))
+        if self.headless:
+            self.screen = Surface((self.width, self.height))
+        else:
+            self.screen = display.set_mode((self.width, self.height))
+        self.invalidate_background()
 
     def get_delta_time(self, units: int = 1000) -> float:
+        """Ticks the clock, waiting to keep to frames_per_second
+
+        Args:
+            units (int, optional): Clock ticks per returned unit. Defaults to 1000 (seconds).
+
+        Returns:
+            float: Time since the last call. In headless mode, 1 / frames_per_second without waiting
+        """
+        if self.headless:
+            self.clock.tick()
+            return (
+                1000 / self.frames_per_second / units if self.frames_per_second else 0.0
+            )
+
         return self.clock.tick(self.frames_per_second) / units
 
+    def mark_dirty(self, *rects: Rect | None):
+        """Records regions drawn this frame. In dirty rect mode only these regions,
+        and last frame's, are erased and pushed to the display
+
+        Args:
+            *rects (Rect | None): Drawn regions, e.g. the Rect returned by a draw or blit call
+        """
+        self._dirty.extend(Rect(rect) for rect in rects if rect is not None)
+
+    @property
+    def bg_color(self) -> ColorType | None:
+        return self._bg_color
+
+    @bg_color.setter
+    def bg_color(self, value: ColorType | None):
+        self._bg_color = value
+        self.invalidate_background()
+
+    @property
+    def bg_image(self) -> Surface | None:
+        return self._bg_image
+
+    @bg_image.setter
+    def bg_image(self, value: Surface | None):
+        self._bg_image = value
+        self.invalidate_background()
+
+    @property
+    def background(self) -> Surface:
+        """The static layer: bg_color, bg_image and static drawables, rendered once
+        in the display format and kept until invalidated
+        """
+        if self._background is None:
+            background = Surface(self.screen.get_size())
+            if not self.headless and display.get_surface() is not None:
+                background = background.convert()
+
+            background.fill(self.bg_color or "black")
+            if self.bg_image is not None:
+                background.blit(self.bg_image, (0, 0))
+            for drawable in self._static_drawables:
+                drawable(background)
+
+            self._background = background
+
+        return self._background
+
+    def add_static(self, drawable: StaticDrawable):
+        """Registers a drawable rendered into the static background layer
+
+        Args:
+            drawable (StaticDrawable): Called with the background Surface whenever the layer is rebuilt
+        """
+        self._static_drawables.append(drawable)
+        self.invalidate_background()
+
+    def invalidate_background(self):
+        """Rebuilds the static background layer and redraws the whole screen next frame.
+        Call when something a static drawable depends on changes
+        """
+        self._background = None
+        self._full_redraw = True
+
+    def draw_background(self, rect: Rect | None = None):
+        """Restores the static background layer over rect with one blit
+
+        Args:
+            rect (Rect | None, optional): The region to draw. Whole screen if None. Defaults to None.
+        """
+        if rect is None:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.blit(self.background, rect, rect)
+
+    def draw_sprites(self, *groups: Iterable[Sprite]):
+        """Draws the image of every on-screen sprite at its rect with a single Surface.blits call.
+        With a camera, rects are world coordinates and sprites outside the view are culled.
+        In dirty rect mode the drawn regions are marked dirty
+
+        Args:
+            *groups (Iterable[Sprite]): Sprite groups, or any iterables of sprites with image and rect
+        """
+        camera = self.camera
+        if camera is None:
+            screen_rect = self.screen.get_rect()
+            sequence = [
+                (sprite.image, sprite.rect)
+                for group in groups
+                for sprite in group
+                if screen_rect.colliderect(sprite.rect)
+            ]
+        else:
+            sequence = [
+                (sprite.image, camera.apply(sprite.rect))
+                for group in groups
+                for sprite in camera.visible(group)
+            ]
+
+        rects = self.screen.blits(sequence, doreturn=self.dirty_rects)
+        if rects:
+            self._dirty.extend(rects)
+
+    def clear_screen(self):
+        """In dirty rect mode, draws the background over last frame's dirty regions,
+        or the whole screen on the first frame. Called by Game before update_screen
+        """
+        if not self.dirty_rects:
+            return
+
+        if self._full_redraw:
+            self.draw_background()
+        else:
+            for rect in self._last_dirty:
+                self.draw_background(rect)
+
+    def flip(self):
+        """Pushes the drawn frame to the display. Does nothing in headless mode.
+        In dirty rect mode only this frame's and last frame's dirty regions are pushed
+        """
+        if self.dirty_rects and not self._full_redraw:
+            if not self.headless:
+                display.update(self._last_dirty + self._dirty)
+        elif not self.headless:
+            display.flip()
+
+        self._last_dirty = self._dirty
+        self._dirty = []
+        self._full_redraw = False
+
     @abstractmethod
     def update_screen(self):
         """Define logic for screen activity.  Required"""
@@ -0,0 +1,315 @@
+import heapq
+import math
+from collections.abc import Iterable, Iterator
+
+from pygame import Rect
+from pygame.sprite import Group, Sprite
+
+from .sprites import GameSprite
+
+CellRange = tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """Uniform grid broad phase. Sprites are bucketed into every cell their rect overlaps,
+    so only sprites sharing a cell are reported as candidate collision pairs
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """Creates new instance of SpatialHash object
+
+        Args:
+            cell_size (int, optional): Width and height of a grid cell. Should be about the size of a typical sprite. Defaults to 64.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], set[Sprite]] = {}
+        self._sprite_cells: dict[Sprite, CellRange] = {}
+
+    def __len__(self) -> int:
+        return len(self._sprite_cells)
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        return sprite in self._sprite_cells
+
+    def clear(self):
+        """Removes every sprite from the grid"""
+        self._cells.clear()
+        self._sprite_cells.clear()
+
+    def insert(self, sprite: Sprite):
+        """Adds sprite to every cell its rect overlaps
+
+        Args:
+            sprite (Sprite): A sprite with a rect
+        """
+        cell_range = self._cell_range(sprite.rect)
+        self._sprite_cells[sprite] = cell_range
+        self._add_cells(sprite, cell_range)
+
+    def remove(self, sprite: Sprite):
+        """Removes sprite from the grid, if present
+
+        Args:
+            sprite (Sprite): The sprite to remove
+        """
+        cell_range = self._sprite_cells.pop(sprite, None)
+        if cell_range is not None:
+            self._remove_cells(sprite, cell_range)
+
+    def update(self, sprite: Sprite):
+        """Moves sprite to the cells of its current rect. Sprites that stayed
+        in the same cells are not touched
+
+        Args:
+            sprite (Sprite): The sprite to update. Inserted if not present
+        """
+        cell_range = self._cell_range(sprite.rect)
+        old_range = self._sprite_cells.get(sprite)
+
+        if old_range == cell_range:
+            return
+
+        if old_range is not None:
+            self._remove_cells(sprite, old_range)
+        self._sprite_cells[sprite] = cell_range
+        self._add_cells(sprite, cell_range)
+
+    def rebuild(self, sprites: Iterable[Sprite]):
+        """Clears the grid and inserts every given sprite
+
+        Args:
+            sprites (Iterable[Sprite]): The sprites to index
+        """
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def sync(self, sprites: Iterable[Sprite]):
+        """Incrementally updates the grid to hold exactly the given sprites
+
+        Args:
+            sprites (Iterable[Sprite]): The sprites to index
+        """
+        current = set()
+        for sprite in sprites:
+            current.add(sprite)
+            self.update(sprite)
+
+        for sprite in [s for s in self._sprite_cells if s not in current]:
+            self.remove(sprite)
+
+    def query(self, rect: Rect) -> set[Sprite]:
+        """Finds sprites in cells overlapping rect. Results may not collide with rect
+
+        Args:
+            rect (Rect): The area to search
+
+        Returns:
+            set[Sprite]: Sprites near rect
+        """
+        found: set[Sprite] = set()
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+
+        return found
+
+    def nearest(self, point: tuple[float, float], k: int = 1) -> list[Sprite]:
+        """The k sprites whose rect centers are closest to point. Searches rings of
+        cells outward from point, stopping once no unsearched cell can be closer
+
+        Args:
+            point (tuple[float, float]): The search center
+            k (int, optional): Number of sprites. Defaults to 1.
+
+        Returns:
+            list[Sprite]: Up to k sprites, closest first
+        """
+        if k <= 0:
+            return []
+
+        distances: dict[Sprite, float] = {}
+        size = self.cell_size
+        cx, cy = int(point[0] // size), int(point[1] // size)
+
+        def measure(cells: Iterable[set[Sprite] | None]):
+            for cell in cells:
+                for sprite in cell or ():
+                    if sprite not in distances:
+                        distances[sprite] = math.dist(point, sprite.rect.center)
+
+        r = 0
+        while len(distances) < len(self._sprite_cells):
+            if (2 * r + 1) ** 2 >= len(self._cells):
+                # the rings would cover more cells than are occupied
+                measure(self._cells.values())
+                break
+
+            measure(self._cells.get(key) for key in self._ring(cx, cy, r))
+            # sprites in unsearched cells are at least r cells away
+            if (
+                len(distances) >= k
+                and heapq.nsmallest(k, distances.values())[-1] <= r * size
+            ):
+                break
+            r += 1
+
+        return heapq.nsmallest(k, distances, key=distances.__getitem__)
+
+    def candidate_pairs(self) -> set[tuple[Sprite, Sprite]]:
+        """Every pair of sprites sharing at least one cell. Each pair is reported once
+
+        Returns:
+            set[tuple[Sprite, Sprite]]: Pairs to pass to a narrow phase check such as sprite.collide_circle
+        """
+        pairs: set[tuple[Sprite, Sprite]] = set()
+        for cell in self._cells.values():
+            if len(cell) < 2:
+                continue
+
+            members = sorted(cell, key=id)
+            for i, a in enumerate(members):
+                for b in members[i + 1 :]:
+                    pairs.add((a, b))
+
+        return pairs
+
+    @staticmethod
+    def _ring(cx: int, cy: int, r: int) -> Iterator[tuple[int, int]]:
+        if r == 0:
+            yield cx, cy
+            return
+
+        for x in range(cx - r, cx + r + 1):
+            yield x, cy - r
+            yield x, cy + r
+        for y in range(cy - r + 1, cy + r):
+            yield cx - r, y
+            yield cx + r, y
+
+    def _cell_range(self, rect: Rect) -> CellRange:
+        size = self.cell_size
+        x, y, w, h = rect
+        return (
+            int(x // size),
+            int(y // size),
+            int((x + max(w - 1, 0)) // size),
+            int((y + max(h - 1, 0)) // size),
+        )
+
+    def _add_cells(self, sprite: Sprite, cell_range: CellRange):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is None:
+                    cell = self._cells[(cx, cy)] = set()
+                cell.add(sprite)
+
+    def _remove_cells(self, sprite: Sprite, cell_range: CellRange):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(sprite)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+
+class SpatialGroup(Group):
+    """Sprite group indexed by a SpatialHash and by GameSprite.id. GameSprites are
+    re-indexed when _update_pos moves them, so region queries never scan the whole group.
+    Call refresh() after moving other sprites
+    """
+
+    def __init__(self, *sprites: Sprite, cell_size: int = 64):
+        """Creates new instance of SpatialGroup object
+
+        Args:
+            *sprites (Sprite): Any sprites to add
+            cell_size (int, optional): Grid cell size, about the size of a typical sprite. Defaults to 64.
+        """
+        self.index = SpatialHash(cell_size)
+        self._ids: dict[int, Sprite] = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.index.insert(sprite)
+        if isinstance(sprite, GameSprite):
+            self._ids[sprite.id] = sprite
+            sprite.add_move_listener(self.index.update)
+
+    def remove_internal(self, sprite: Sprite):
+        super().remove_internal(sprite)
+        self.index.remove(sprite)
+        if isinstance(sprite, GameSprite):
+            if self._ids.get(sprite.id) is sprite:
+                del self._ids[sprite.id]
+            sprite.remove_move_listener(self.index.update)
+
+    def refresh(self):
+        """Re-indexes every sprite, for sprites moved without _update_pos or notify_moved"""
+        for sprite in self.spritedict:
+            self.index.update(sprite)
+
+    def get(self, id: int) -> Sprite | None:
+        """The sprite with GameSprite.id id. Ids should be unique within the group
+
+        Args:
+            id (int): The id
+
+        Returns:
+            Sprite | None: The sprite, or None if no sprite has the id
+        """
+        return self._ids.get(id)
+
+    def query_rect(self, rect: Rect) -> list[Sprite]:
+        """Sprites whose rect collides with rect, e.g. the screen
+
+        Args:
+            rect (Rect): The area
+
+        Returns:
+            list[Sprite]: The colliding sprites
+        """
+        return [s for s in self.index.query(rect) if rect.colliderect(s.rect)]
+
+    def query_radius(self, center: tuple[float, float], radius: float) -> list[Sprite]:
+        """Sprites whose rect center is within radius of center
+
+        Args:
+            center (tuple[float, float]): The search center
+            radius (float): The search radius
+
+        Returns:
+            list[Sprite]: The sprites in range
+        """
+        x, y = center
+        area = Rect(
+            int(x - radius), int(y - radius), int(2 * radius) + 2, int(2 * radius) + 2
+        )
+        return [
+            s
+            for s in self.index.query(area)
+            if math.dist(center, s.rect.center) <= radius
+        ]
+
+    def nearest(self, point: tuple[float, float], k: int = 1) -> list[Sprite]:
+        """The k sprites whose rect centers are closest to point
+
+        Args:
+            point (tuple[float, float]): The search center
+            k (int, optional): Number of sprites. Defaults to 1.
+
+        Returns:
+            list[Sprite]: Up to k sprites, closest first
+        """
+        return self.index.nearest(point, k)
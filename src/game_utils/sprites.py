@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
+import numpy as np
 from pygame import Rect, Surface, Vector2
 from pygame.sprite import Sprite
 
@@ -31,6 +32,9 @@ class GameSprite(Sprite):
         self.position = position
         self.boundaries = boundaries
         self.id = id
+        # cleared while the sprite waits in a SpritePool
+        self.active = True
+        self._move_listeners: list[Callable[[GameSprite], None]] = []
 
     @abstractmethod
     def update(self, *args: Any, **kwargs: Any):
@@ -90,6 +94,23 @@ class GameSprite(Sprite):
         y = self.position.y - h / 2
 
         self.rect = Rect(x, y, w, h)
+        self.notify_moved()
+
+    def add_move_listener(self, listener: Callable[["GameSprite"], None]):
+        """Registers a callback invoked with this sprite whenever its rect moves, e.g. by a SpatialGroup
+
+        Args:
+            listener (Callable[[GameSprite], None]): The callback
+        """
+        self._move_listeners.append(listener)
+
+    def remove_move_listener(self, listener: Callable[["GameSprite"], None]):
+        self._move_listeners.remove(listener)
+
+    def notify_moved(self):
+        """Invokes move listeners. Called by _update_pos. Call after changing rect directly"""
+        for listener in self._move_listeners:
+            listener(self)
 
     def __str__(self) -> str:
         return str(tuple(self.rect))
@@ -110,6 +131,23 @@ class PhysicsSprite(GameSprite):
         self.physics_body = physics_body
         self.physics_body.position = self.position
 
+    def _update_pos(
+        self,
+        position: Vector2 | None = None,
+        xbounds: Callable[[], None] | None = None,
+        ybounds: Callable[[], None] | None = None,
+    ):
+        # bodies in a PhysicsWorld hand out copies of their position, so follow
+        # the world's position in place and write the bounded position back to it
+        in_world = self.physics_body.world is not None
+        if position is None and in_world:
+            self.position.update(self.physics_body.position)
+
+        super()._update_pos(position, xbounds, ybounds)
+
+        if in_world:
+            self.physics_body.position = self.position
+
 
 class PlayerSprite(PhysicsSprite):
     """GameSprite with PhysicsBody and Controller input"""
@@ -125,3 +163,115 @@ class PlayerSprite(PhysicsSprite):
     ):
         super().__init__(image, position, physics_body, boundaries, id)
         self.controller = controller
+
+
+def clamp_to_bounds(
+    positions: np.ndarray,
+    sizes: np.ndarray,
+    bounds: np.ndarray,
+    velocities: np.ndarray | None = None,
+    elasticity: np.ndarray | float = 1.0,
+    reflect: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized GameSprite._update_pos boundary check. Clamps positions in place and,
+    if velocities are given, reflects or stops them in place on every axis that hit a bound.
+    Works directly on PhysicsWorld.positions and PhysicsWorld.velocities
+
+    Args:
+        positions (np.ndarray): Shape (n, 2) sprite centers
+        sizes (np.ndarray): Shape (n, 2) sprite widths and heights
+        bounds (np.ndarray): Shape (n, 4) boundaries as (xmax, xmin, ymax, ymin)
+        velocities (np.ndarray | None, optional): Shape (n, 2) velocities. Defaults to None.
+        elasticity (np.ndarray | float, optional): Velocity is scaled by this once per bound hit when reflecting. Defaults to 1.0.
+        reflect (bool, optional): Reverse the velocity on a hit axis. If False, stop it instead. Defaults to True.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Masks of the rows that hit an x bound and a y bound
+    """
+    half = sizes / 2
+    upper = bounds[:, [0, 2]] - half
+    lower = bounds[:, [1, 3]] + half
+
+    above = positions > upper
+    below = ~above & (positions < lower)
+    np.copyto(positions, upper, where=above)
+    np.copyto(positions, lower, where=below)
+
+    hits = above | below
+    if velocities is not None:
+        if reflect:
+            velocities[hits] *= -1
+            scale = np.asarray(elasticity, dtype=float) ** hits.sum(axis=1)
+            velocities *= np.broadcast_to(scale, len(velocities))[:, None]
+        else:
+            velocities[hits] = 0
+
+    return hits[:, 0], hits[:, 1]
+
+
+def bound_sprites(
+    sprites: Iterable[GameSprite], reflect: bool = True
+) -> tuple[list[GameSprite], np.ndarray, np.ndarray]:
+    """Applies every sprite's boundaries in one vectorized pass with clamp_to_bounds,
+    and updates their rects. PhysicsSprite velocities are reflected, scaled by
+    elasticity, or stopped. Sprites without boundaries are skipped
+
+    Args:
+        sprites (Iterable[GameSprite]): The sprites, e.g. a sprite group
+        reflect (bool, optional): Reverse velocity on a hit axis. If False, stop it instead. Defaults to True.
+
+    Returns:
+        tuple[list[GameSprite], np.ndarray, np.ndarray]: The bounded sprites, and masks of which hit an x bound and a y bound.
+        Run per-sprite callbacks only for those, e.g. for i in np.flatnonzero(hit_x)
+    """
+    bounded = [sprite for sprite in sprites if sprite.boundaries is not None]
+    n = len(bounded)
+    if n == 0:
+        empty = np.zeros(0, dtype=bool)
+        return bounded, empty, empty
+
+    bodies = [
+        sprite.physics_body if isinstance(sprite, PhysicsSprite) else None
+        for sprite in bounded
+    ]
+    positions = np.array(
+        [
+            body.position if body is not None else sprite.position
+            for sprite, body in zip(bounded, bodies)
+        ],
+        dtype=float,
+    )
+    sizes = np.array([sprite.rect.size for sprite in bounded], dtype=float)
+    bounds = np.array([tuple(sprite.boundaries) for sprite in bounded], dtype=float)
+    velocities = np.array(
+        [body.velociy if body is not None else (0, 0) for body in bodies],
+        dtype=float,
+    )
+    elasticity = np.array(
+        [body.elasticity if body is not None else 1.0 for body in bodies]
+    )
+
+    hit_x, hit_y = clamp_to_bounds(
+        positions, sizes, bounds, velocities, elasticity, reflect
+    )
+
+    hit = hit_x | hit_y
+    for i, (sprite, body) in enumerate(zip(bounded, bodies)):
+        if body is not None and body.world is None:
+            # detached bodies share their position vector with the sprite
+            sprite.position = body.position
+
+        x, y = positions[i]
+        sprite.position.update(x, y)
+        w, h = sprite.rect.size
+        # truncate like the Rect built by _update_pos
+        sprite.rect.topleft = (int(x - w / 2), int(y - h / 2))
+        sprite.notify_moved()
+
+        if body is not None:
+            if body.world is not None:
+                body.position = sprite.position
+            if hit[i]:
+                body.velociy = Vector2(*velocities[i])
+
+    return bounded, hit_x, hit_y
@@ -1,17 +1,125 @@
 from collections.abc import Callable
 
-from numpy.random import choice, rand
+import numpy as np
 from pygame import Vector2
 
 
-def get_random_vector(scalar_mag: float = 1.0, non_negative: bool = False) -> Vector2:
-    def rand_sign() -> int:
-        return choice([-1, 1]) if not non_negative else 1
+class RandomSource:
+    """Seedable random numbers backed by a numpy.random.Generator. Values are generated
+    in blocks and handed out in batches, so many small draws cost one NumPy call per block
+    """
 
-    return Vector2(
-        x=rand() * rand_sign() * scalar_mag,
-        y=rand() * rand_sign() * scalar_mag,
-    )
+    def __init__(self, seed: int | None = None, block_size: int = 4096):
+        """Creates new instance of RandomSource object
+
+        Args:
+            seed (int | None, optional): Seed for reproducible runs. Random if None. Defaults to None.
+            block_size (int, optional): Values generated at once per distribution. Defaults to 4096.
+        """
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._uniform = np.empty(0)
+        self._uniform_pos = 0
+        self._normal = np.empty(0)
+        self._normal_pos = 0
+
+    def random(self, n: int) -> np.ndarray:
+        """n uniform values in [0, 1)
+
+        Args:
+            n (int): Number of values
+
+        Returns:
+            np.ndarray: Shape (n,)
+        """
+        if self._uniform_pos + n > len(self._uniform):
+            self._uniform = self._refill(self._uniform[self._uniform_pos :], n, False)
+            self._uniform_pos = 0
+
+        values = self._uniform[self._uniform_pos : self._uniform_pos + n]
+        self._uniform_pos += n
+        return values
+
+    def normal(self, n: int, loc: float = 0.0, scale: float = 1.0) -> np.ndarray:
+        """n normally distributed values
+
+        Args:
+            n (int): Number of values
+            loc (float, optional): Mean. Defaults to 0.0.
+            scale (float, optional): Standard deviation. Defaults to 1.0.
+
+        Returns:
+            np.ndarray: Shape (n,)
+        """
+        if self._normal_pos + n > len(self._normal):
+            self._normal = self._refill(self._normal[self._normal_pos :], n, True)
+            self._normal_pos = 0
+
+        values = self._normal[self._normal_pos : self._normal_pos + n]
+        self._normal_pos += n
+        return values * scale + loc
+
+    def _refill(self, remaining: np.ndarray, n: int, normal: bool) -> np.ndarray:
+        size = max(self.block_size, n - len(remaining))
+        block = (
+            self.generator.standard_normal(size)
+            if normal
+            else self.generator.random(size)
+        )
+        return np.concatenate((remaining, block))
+
+
+_random_source = RandomSource()
+
+
+def get_random_source() -> RandomSource:
+    """The module-wide RandomSource used when none is given"""
+    return _random_source
+
+
+def set_random_source(source: RandomSource):
+    """Replaces the module-wide RandomSource, e.g. with a seeded one
+
+    Args:
+        source (RandomSource): The new default source
+    """
+    global _random_source
+    _random_source = source
+
+
+def get_random_vector(
+    scalar_mag: float = 1.0,
+    non_negative: bool = False,
+    source: RandomSource | None = None,
+) -> Vector2:
+    x, y = get_random_vectors(1, scalar_mag, non_negative, source)[0]
+
+    return Vector2(x, y)
+
+
+def get_random_vectors(
+    n: int,
+    scalar_mag: float = 1.0,
+    non_negative: bool = False,
+    source: RandomSource | None = None,
+) -> np.ndarray:
+    """n random vectors at once. Each component is uniform in [-scalar_mag, scalar_mag),
+    or [0, scalar_mag) if non_negative
+
+    Args:
+        n (int): Number of vectors
+        scalar_mag (float, optional): Largest magnitude of each component. Defaults to 1.0.
+        non_negative (bool, optional): Only non-negative components. Defaults to False.
+        source (RandomSource | None, optional): Where to draw from. The module-wide source if None. Defaults to None.
+
+    Returns:
+        np.ndarray: Shape (n, 2)
+    """
+    values = (source or _random_source).random(n * 2).reshape(n, 2)
+    if non_negative:
+        return values * scalar_mag
+
+    return (values * 2 - 1) * scalar_mag
 
 
 def apply_vector_actions(
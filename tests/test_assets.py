@@ -0,0 +1,60 @@
+import pygame.display
+import pygame.image
+from pygame import Surface
+
+from game_utils.assets import *
+
+
+def test_asset_loader(tmp_path):
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(Surface((100, 100)), path)
+
+    progress = []
+    loader = AssetLoader(max_workers=2, on_progress=lambda *p: progress.append(p))
+    loader.add_list("list", path, n_sprites=5)
+    loader.add_map("map", path, keys=["a", "b"], n_sprites=2)
+    loader.add_list("missing", str(tmp_path / "missing.png"))
+
+    assert loader.progress == 0.0
+    assets = loader.wait()
+
+    assert loader.done
+    assert loader.progress == 1.0
+    assert isinstance(assets["list"], SpriteSheetList)
+    assert assets["map"]["b"].get_size() == (100, 50)
+    assert "missing" in loader.errors
+    assert progress[-1] == (3, 3)
+
+    # failed assets aren't submitted again
+    pygame.image.save(Surface((10, 10)), str(tmp_path / "missing.png"))
+    loader.wait()
+    assert "missing" not in loader.assets
+    assert (loader.loaded, loader.total) == (3, 3)
+    assert loader.done
+    assert loader._executor is None
+
+
+def test_asset_loader_converts_later(tmp_path, monkeypatch):
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(Surface((20, 10)), path)
+    pygame.display.quit()
+
+    loader = AssetLoader()
+    loader.add_list("list", path, n_sprites=2, preload=True)
+    sheet = loader.wait()["list"]
+    image = sheet.spritesheet
+
+    # no display yet, so the sheet keeps the decoded image until one exists
+    loader.convert_all()
+    assert sheet.spritesheet is image
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    try:
+        display = pygame.display.set_mode((10, 10))
+        loader.poll()
+        assert sheet.spritesheet is not image
+        assert sheet.spritesheet.get_bitsize() == display.get_bitsize()
+        assert len(sheet._cache) == 2
+    finally:
+        pygame.display.quit()
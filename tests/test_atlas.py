@@ -0,0 +1,46 @@
+import pytest
+from pygame import Rect, Surface
+
+from game_utils.atlas import *
+from game_utils.images import SpriteSheetList
+
+
+def make_sheet() -> SpriteSheetList:
+    sheet = SpriteSheetList(spritesheet=Surface((100, 20)), n_sprites=5)
+    sheet.sprite_rects = [Rect(i * 20, 0, 20, 20) for i in range(5)]
+    return sheet
+
+
+def test_atlas_builder():
+    builder = AtlasBuilder(max_size=(64, 64))
+    builder.add_sheet("walk", make_sheet())
+    builder.add_image("tree", Surface((30, 40)))
+    atlas = builder.build()
+
+    assert len(atlas) == 6
+    assert len(atlas.pages) == 2
+    assert atlas["tree"].get_size() == (30, 40)
+    assert atlas.get("walk/4").get_size() == (20, 20)
+    assert atlas.get("missing") is None
+
+    for page, rect in atlas.rects.values():
+        assert atlas.pages[page].rect.contains(rect)
+
+    with pytest.raises(ValueError):
+        atlas.sprite_map("walk")
+
+
+def test_atlas_save_load(tmp_path):
+    builder = AtlasBuilder()
+    builder.add_sheet("walk", make_sheet())
+    atlas = builder.build()
+
+    walk = atlas.sprite_map("walk")
+    assert walk["3"].get_size() == (20, 20)
+
+    path = str(tmp_path / "atlas.json")
+    atlas.save(path)
+    loaded = TextureAtlas.load(path)
+
+    assert loaded.rects == atlas.rects
+    assert loaded["walk/2"].get_size() == (20, 20)
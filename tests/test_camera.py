@@ -0,0 +1,66 @@
+from pygame import Color, Rect, Surface, Vector2
+
+from game_utils.camera import *
+from game_utils.screen import ScreenSettings
+from game_utils.spatial import SpatialGroup
+from game_utils.sprites import GameSprite
+
+
+class MockSprite(GameSprite):
+    def __init__(self, x: float, y: float):
+        image = Surface((10, 10))
+        image.fill("white")
+        super().__init__(image, Vector2(x, y))
+        self._update_pos()
+        self.updates: list[float] = []
+
+    def update(self, *args, **kwargs):
+        self.updates.append(args[0])
+
+
+class MockScreenSettings(ScreenSettings):
+    def update_screen(self):
+        pass
+
+
+def test_camera_transforms():
+    camera = Camera(100, 50, Vector2(500, 500), world_bounds=Rect(0, 0, 1000, 1000))
+    assert camera.rect == Rect(450, 475, 100, 50)
+    assert camera.world_to_screen((450, 475)) == Vector2(0, 0)
+    assert camera.screen_to_world((10, 10)) == Vector2(460, 485)
+    assert camera.apply(Rect(460, 480, 5, 5)) == Rect(10, 5, 5, 5)
+
+    camera.follow(Vector2(0, 0))
+    assert camera.rect.topleft == (0, 0)
+
+    camera.follow(Vector2(100, 100), smoothing=0.5)
+    assert camera.position == Vector2(75, 62.5)
+
+
+def test_camera_culling():
+    near = MockSprite(520, 520)
+    far = MockSprite(900, 900)
+    camera = Camera(100, 100, Vector2(500, 500))
+
+    for group in ([near, far], SpatialGroup(near, far)):
+        assert camera.visible(group) == [near]
+
+    ss = MockScreenSettings(width=100, height=100, headless=True, camera=camera)
+    ss.draw_sprites([near, far])
+    assert ss.screen.get_at((70, 70)) == Color("white")
+    assert ss.screen.get_at((20, 20)) == Color("black")
+
+
+def test_camera_far_updates():
+    near = MockSprite(500, 500)
+    far = [MockSprite(2000, 2000 + i * 20) for i in range(4)]
+    camera = Camera(100, 100, Vector2(500, 500), far_margin=50, far_interval=2)
+
+    for _ in range(4):
+        camera.update_sprites([near, *far], 0.1)
+
+    assert len(near.updates) == 4
+    # far sprites update every other frame, spread across frames
+    assert [len(sprite.updates) for sprite in far] == [2, 2, 2, 2]
+    assert sum(far[0].updates) + sum(far[1].updates) > 0.6
+    assert round(far[1].updates[-1], 6) == 0.2
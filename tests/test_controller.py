@@ -1,3 +1,5 @@
+import gc
+
 from pygame import Vector2
 
 from game_utils.controller import *
@@ -58,3 +60,113 @@ def test_controller():
     assert c.direction() == DIRECTIONS[-1]
     c.action_ = MockActions.ACTION_B
     assert c.direction() == DIRECTIONS[1]
+
+
+def test_input_snapshot():
+    pygame.init()
+    pressed = [False] * 512
+    keys = pygame.key.ScancodeWrapper(range(512))
+    pressed[keys[K_RIGHT]] = True
+    pressed[keys[K_UP]] = True
+
+    Controller.snapshot = InputSnapshot(
+        keys=pygame.key.ScancodeWrapper(pressed),
+        joysticks={},
+        mouse_position=(0, 0),
+        mouse_buttons=(False, False, False),
+    )
+    try:
+        c = DefaultKeyboardController(2.0, *DEFAULT_KEYBOARD_ACTIONS)
+        assert c.direction() == Vector2(2.0, -2.0)
+        assert c.action(DefaultKeyboardController.Commands.QUIT.value) == 0.0
+    finally:
+        Controller.clear_input()
+
+    assert Controller.snapshot is None
+
+
+class MockJoystick:
+    def __init__(self, instance_id: int, axes, buttons, hats):
+        self.instance_id = instance_id
+        self.axes = axes
+        self.buttons = buttons
+        self.hats = hats
+        self.initialized = True
+
+    def get_instance_id(self):
+        return self.instance_id
+
+    def get_init(self):
+        return self.initialized
+
+    def get_numaxes(self):
+        return len(self.axes)
+
+    def get_numbuttons(self):
+        return len(self.buttons)
+
+    def get_numhats(self):
+        return len(self.hats)
+
+    def get_axis(self, i):
+        return self.axes[i]
+
+    def get_button(self, i):
+        return self.buttons[i]
+
+    def get_hat(self, i):
+        return self.hats[i]
+
+
+JOYSTICK_ACTIONS: list[VectorAction] = [
+    {"input_id": 0, "action_type": "axis", "action_name": "x_axis_pos"},
+    {"input_id": 0, "action_type": "hat", "action_name": "y_axis_pos", "hat_axis": "y"},
+    {"input_id": 1, "action_type": "button", "action_name": "quit"},
+]
+
+
+def test_controller_group():
+    pygame.init()
+    joysticks = [
+        MockJoystick(100, [0.5, 0.0], [False, True], [(1, -1)]),
+        MockJoystick(101, [-0.25], [False, False], [(0, 1)]),
+    ]
+    controllers = [JoystickController(j, 2.0, *JOYSTICK_ACTIONS) for j in joysticks] + [
+        DefaultKeyboardController(3.0, *DEFAULT_KEYBOARD_ACTIONS)
+    ]
+
+    group = ControllerGroup(controllers)
+    snapshot = InputSnapshot.capture(joysticks)
+
+    values = group.evaluate(snapshot)
+    assert values.shape == (3, len(group.action_names))
+    for row, c in enumerate(controllers[:2]):
+        for name in c.actions:
+            assert values[row, group.action_names.index(name)] == c.action(name)
+
+    assert controllers[0].action("y_axis_pos") == -1.0
+    assert list(group.action("quit", snapshot)) == [1.0, 0.0, 0.0]
+
+    directions = group.directions(snapshot)
+    assert list(directions[0]) == [1.0, -2.0]
+    assert list(directions[1]) == [-0.5, 2.0]
+    assert list(directions[2]) == [0.0, 0.0]
+
+
+def test_joystick_registry():
+    joysticks = [MockJoystick(i, [0.0], [False], []) for i in (200, 201, 202)]
+    controllers = [JoystickController(j, 1.0, *JOYSTICK_ACTIONS) for j in joysticks]
+    assert set(Controller.registered_joysticks()) >= {200, 201, 202}
+
+    joysticks[0].initialized = False
+    controllers[1].close()
+    Controller.unregister_joystick(202)
+    assert not {200, 201, 202} & set(Controller.registered_joysticks())
+
+    joysticks[0].initialized = True
+    assert 200 in Controller.registered_joysticks()
+
+    # controllers are held weakly
+    del controllers
+    gc.collect()
+    assert 200 not in Controller.registered_joysticks()
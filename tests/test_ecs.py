@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from pygame import Rect, Surface, Vector2
+
+from game_utils.ecs import *
+from game_utils.physics import PhysicsBody, PhysicsWorld
+from game_utils.sprites import PhysicsSprite
+
+
+class MockSprite(PhysicsSprite):
+    def update(self, *args, **kwargs):
+        pass
+
+
+def test_entity_world_storage():
+    world = EntityWorld(Component("health", int, (), 100), capacity=1)
+    a = world.spawn(position=(1, 2), velocity=(1, 0))
+    b = world.spawn(position=(3, 4), velocity=(0, 1))
+    c = world.spawn(position=(5, 6))
+
+    assert len(world) == 3
+    assert len(world.archetypes) == 2
+
+    world.despawn(a)
+    assert a not in world
+    assert world.get(b, "position").tolist() == [3, 4]
+
+    world.set(b, "health", 50)
+    assert world.get(b, "health") == 50
+    assert world.get(b, "velocity").tolist() == [0, 1]
+
+    world.discard(b, "velocity")
+    assert [len(archetype) for archetype in world.query("position")] == [1, 1]
+    assert [len(archetype) for archetype in world.query("velocity")] == []
+
+    world.set(c, "health", 25)
+    assert world.get(c, "health") == 25
+    assert world.get(c, "position").tolist() == [5, 6]
+    assert [len(archetype) for archetype in world.query("health")] == [2]
+
+    # a failed set() leaves the entity where it was
+    with pytest.raises(KeyError):
+        world.set(c, "bogus", 1)
+    assert c in world
+    assert len(world) == 2
+    assert world.get(c, "position").tolist() == [5, 6]
+
+
+def test_systems_match_physics_world():
+    bodies = [
+        PhysicsBody(mass=2, position=Vector2(i + 10, 50), velocity=Vector2(1, i))
+        for i in range(5)
+    ]
+    expected = PhysicsWorld(
+        *(
+            PhysicsBody(mass=2, position=Vector2(i + 10, 50), velocity=Vector2(1, i))
+            for i in range(5)
+        )
+    )
+    for body, e in zip(bodies, expected):
+        body.static_friction = e.static_friction
+        body.kinetic_friction = e.kinetic_friction
+
+    world = EntityWorld()
+    sprites = [
+        MockSprite(Surface((4, 4)), body.position, body, Rect(100, 0, 100, 0))
+        for body in bodies
+    ]
+    for sprite in sprites:
+        world.add_sprite(sprite)
+    world.add_system(physics_system, *PHYSICS)
+    world.add_system(bounds_system, "position", "size", "boundaries")
+
+    accel = Vector2(0.5, -0.25)
+    for _ in range(3):
+        expected.force(accel, 0.1)
+        for archetype in world.query("acceleration"):
+            archetype["acceleration"][:] = accel
+        world.run(0.1)
+
+    (archetype,) = world.query(*PHYSICS)
+    assert np.allclose(archetype["position"], expected.positions)
+    assert np.allclose(archetype["velocity"], expected.velocities)
+
+    world.sync_sprites()
+    assert sprites[4].physics_body.position == Vector2(*archetype["position"][4])
+    x, y = archetype["position"][4]
+    assert sprites[4].rect.topleft == (int(x - 2), int(y - 2))
+
+    rects = world.draw(Surface((100, 100)))
+    assert len(rects) == 5
@@ -1,9 +1,15 @@
 import logging
+import math
+import os
+import sys
+import tracemalloc
 
 import pygame.event
+import pytest
 from pygame.locals import K_ESCAPE, QUIT, USEREVENT
 
 from game_utils.game import Game
+from game_utils.profiling import AllocationTracker, FrameProfiler
 from game_utils.screen import ScreenSettings
 
 logger = logging.getLogger(__name__)
@@ -35,3 +41,99 @@ def test_run():
     tg.run()
     assert tg.state == 3
     assert tg.event == True
+
+
+class MockFixedGame(Game):
+    def __init__(self):
+        super().__init__(fixed_timestep=0.01, max_steps=3)
+        self.state = 0
+
+    def update(self):
+        self.state += 1
+
+
+def test_advance():
+    tg = MockFixedGame()
+
+    assert tg.advance(0.025) == 2
+    assert tg.state == 2
+    assert tg.dt == 0.01
+    assert 0.49 < tg.alpha < 0.51
+
+    assert tg.advance(0.1) == 3
+    assert tg.state == 5
+    assert tg.dropped_steps == 7
+    assert tg.alpha < 1.0
+
+
+class MockScreenSettings(ScreenSettings):
+    def __init__(self):
+        super().__init__(width=64, height=48, frames_per_second=50, headless=True)
+        self.frames = 0
+
+    def update_screen(self):
+        self.frames += 1
+
+
+class MockHeadlessGame(Game):
+    def __init__(self):
+        super().__init__(MockScreenSettings())
+        self.total_time = 0.0
+
+    def update(self):
+        self.total_time += self.dt
+
+
+def test_run_headless():
+    tg = MockHeadlessGame()
+    tg.run(max_ticks=100)
+
+    assert tg.headless
+    assert tg.ticks == 100
+    assert tg.screen_settings.frames == 100
+    assert tg.screen_settings.screen.get_size() == (64, 48)
+    assert math.isclose(tg.total_time, 99 * 0.02)
+    assert tg.ticks_per_second > 0
+
+
+def test_run_headless_restores_environment(monkeypatch):
+    monkeypatch.delenv("SDL_VIDEODRIVER", raising=False)
+    MockHeadlessGame().run(max_ticks=1)
+    assert "SDL_VIDEODRIVER" not in os.environ
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "offscreen")
+    MockHeadlessGame().run(max_ticks=1)
+    assert os.environ["SDL_VIDEODRIVER"] == "offscreen"
+
+
+def test_run_allocation_tracker_stops_on_error():
+    class FailingGame(MockHeadlessGame):
+        def update(self):
+            raise RuntimeError("update failed")
+
+    tg = FailingGame()
+    tg.allocation_tracker = AllocationTracker()
+    with pytest.raises(RuntimeError):
+        tg.run(max_ticks=10)
+
+    assert sys.getprofile() is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_run_profiler():
+    tg = MockHeadlessGame()
+    tg.profiler = FrameProfiler(overlay=True)
+    tg.run(max_ticks=10)
+
+    phases = tg.profiler.summary()
+    assert set(phases) == {
+        "input",
+        "update",
+        "update_screen",
+        "tick",
+        "overlay",
+        "flip",
+        "events",
+        "frame",
+    }
+    assert len(tg.profiler.samples["frame"]) == 10
@@ -33,3 +33,78 @@ def test_sprite_sheet_map():
     seg = ssheet_map["a"]
     assert seg is not None
     assert seg.get_rect().size == (100, 20)
+
+
+def test_sprite_sheet_cache():
+    ssheet_list = SpriteSheetList(
+        spritesheet=SPRITESHEET_SIM__SURFACT,
+        n_sprites=5,
+        cache_size=2,
+    )
+
+    seg = ssheet_list[0]
+    assert ssheet_list[0] is seg
+    assert (ssheet_list.cache_hits, ssheet_list.cache_misses) == (1, 1)
+
+    ssheet_list[1]
+    ssheet_list[2]
+    assert ssheet_list[0] is not seg
+    assert ssheet_list.cache_misses == 4
+
+    preloaded = SpriteSheetMap(
+        spritesheet=SPRITESHEET_SIM__SURFACT,
+        keys=["a", "b", "c", "d", "e"],
+        n_sprites=5,
+        preload=True,
+    )
+    assert preloaded.cache_size == 5
+    preloaded["e"]
+    assert preloaded.cache_hits == 1
+
+
+def test_sprite_sheet_subsurface():
+    sheet = Surface((100, 20))
+    ssheet_list = SpriteSheetList(spritesheet=sheet, n_sprites=5, subsurface=True)
+    ssheet_list.sprite_rects = [Rect(i * 20, 0, 20, 20) for i in range(5)]
+
+    seg = ssheet_list[1]
+    assert seg.get_parent() is sheet
+    assert seg.get_offset() == (20, 0)
+
+    # segments outside the sheet fall back to a clipped copy
+    seg = ssheet_list.get_spritesheet_segment(Rect(90, 0, 20, 20))
+    assert seg.get_parent() is None
+    assert seg.get_size() == (20, 20)
+
+
+def test_transform_cache():
+    ssheet_list = SpriteSheetList(spritesheet=Surface((40, 20)), n_sprites=2)
+    ssheet_list.sprite_rects = [Rect(0, 0, 20, 20), Rect(20, 0, 20, 20)]
+
+    cache = TransformCache(ssheet_list, angle_buckets=4, scales=(1.0, 2.0))
+
+    rotated = cache.get(0, angle=80)
+    assert cache.get(0, angle=95) is rotated
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.get(1, scale=1.8).get_size() == (40, 40)
+    assert cache.bytes > 0
+
+    cache.preload([0, 1])
+    assert len(cache) == 16
+
+    bounded = TransformCache(
+        ssheet_list, angle_buckets=4, scales=(1.0, 2.0), max_bytes=cache.bytes // 2
+    )
+    bounded.preload([0, 1])
+    assert bounded.bytes <= bounded.max_bytes
+    assert len(bounded) < 16
+
+
+def test_circle_image():
+    circle = get_circle_image("red", 10)
+
+    assert circle.get_size() == (20, 20)
+    assert get_circle_image((255, 0, 0), 10) is circle
+    assert circle.get_at((10, 10)) == (255, 0, 0, 255)
+    assert circle.get_at((0, 0)).a == 0
@@ -1,5 +1,6 @@
 import math
 
+import pytest
 from pygame import Vector2
 
 from game_utils.physics import *
@@ -75,3 +76,109 @@ def test_collisions():
 
     assert d1_t2 is not d1_t1
     assert d2_t2 is not d2_t1
+
+
+def test_physics_world():
+    bodies = [
+        PhysicsBody(mass=2.0, velocity=Vector2(1, 0)),
+        PhysicsBody(mass=1.0, friction=0.5),
+        PhysicsBody(mass=3.0, friction=0.01, velocity=Vector2(0, -2)),
+    ]
+    expected = [
+        PhysicsBody(mass=b.mass, position=b.position, velocity=b.velociy, friction=0.0)
+        for b in bodies
+    ]
+    for e, b in zip(expected, bodies):
+        e.static_friction = b.static_friction
+        e.kinetic_friction = b.kinetic_friction
+
+    world = PhysicsWorld(*bodies, capacity=1)
+    assert len(world) == 3
+    assert bodies[1].world is world
+
+    accel = Vector2(0.5, -0.25)
+    world.force(accel, 0.1)
+    for e in expected:
+        e.force(accel, 0.1)
+
+    for e, b in zip(expected, bodies):
+        assert b.position == e.position
+        assert b.velociy == e.velociy
+
+    world.remove(bodies[0])
+    assert bodies[0].world is None
+    assert bodies[0].position == expected[0].position
+    assert bodies[2].index == 0
+
+    bodies[2].move(0.1)
+    assert tuple(world.positions[0]) == tuple(expected[2].move(0.1))
+
+
+def test_physics_world_vectors_write_through():
+    body = PhysicsBody(velocity=Vector2(2, 1))
+    world = PhysicsWorld(body)
+
+    body.velociy.x = -body.velociy.x
+    body.position.x += 3
+    body.position *= 2
+    assert tuple(world.velocities[0]) == (-2, 1)
+    assert tuple(world.positions[0]) == (6, 0)
+
+    # arithmetic results are plain copies
+    doubled = body.velociy * 2
+    doubled.x = 0
+    assert body.velociy == Vector2(-2, 1)
+
+
+def test_physics_world_collide():
+    def make_bodies():
+        return [
+            PhysicsBody(mass=2.0, velocity=Vector2(-1, 0), elasticity=0.1),
+            PhysicsBody(mass=3.0, velocity=Vector2(1, 0.5)),
+            PhysicsBody(mass=0.5, velocity=Vector2(0, -2), elasticity=0.3),
+            PhysicsBody(mass=1.0, velocity=Vector2(4, 4)),
+        ]
+
+    pairs = [(0, 1), (2, 3), (1, 2), (0, 3)]
+
+    expected = make_bodies()
+    for a, b in pairs:
+        expected[a].on_collide(expected[b])
+        expected[b].on_collide(expected[a])
+
+    bodies = make_bodies()
+    world = PhysicsWorld(*bodies)
+    world.collide(pairs)
+
+    for e, b in zip(expected, bodies):
+        assert b.velociy == e.velociy
+
+    for bad in ([(0, 4)], [(0, -1)]):
+        with pytest.raises(IndexError):
+            world.collide(bad)
+
+
+def test_inplace():
+    for world in (None, PhysicsWorld()):
+        pb = PhysicsBody(mass=2.0, friction=0.01, velocity=Vector2(1, 0))
+        expected = PhysicsBody(mass=2.0, velocity=Vector2(1, 0))
+        expected.static_friction = pb.static_friction
+        expected.kinetic_friction = pb.kinetic_friction
+        if world is not None:
+            world.add(pb)
+
+        position = pb.position
+        for accel in (Vector2(0.5, -0.25), Vector2(0, 0), Vector2(0.01, 0)):
+            assert pb.force_inplace(accel, 0.1) is None
+            expected.force(accel, 0.1)
+
+        pb.move_inplace(0.1)
+        expected.move(0.1)
+
+        assert pb.position == expected.position
+        assert pb.velociy == expected.velociy
+        if world is None:
+            # updated in place, so references held by sprites stay in sync
+            assert position is pb.position
+
+    assert not hasattr(PhysicsBody(), "__dict__")
@@ -0,0 +1,104 @@
+import pytest
+from pygame import Surface, Vector2
+
+from game_utils.physics import PhysicsBody, PhysicsWorld
+from game_utils.pools import *
+from game_utils.sprites import PhysicsSprite
+
+
+class MockSprite(PhysicsSprite):
+    def update(self, *args, **kwargs):
+        self.updates += 1
+
+
+def make_sprite() -> MockSprite:
+    sprite = MockSprite(Surface((4, 4)), Vector2(), PhysicsBody())
+    sprite.updates = 0
+    return sprite
+
+
+def test_object_pool():
+    pool = ObjectPool(list, size=2, reset=list.clear, max_size=3)
+    assert len(pool) == 2 and pool.free == 2
+
+    a = pool.acquire()
+    a.append(1)
+    b = pool.acquire()
+    c = pool.acquire()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    pool.release(a)
+    assert a == []
+    with pytest.raises(ValueError):
+        pool.release(a)
+    with pytest.raises(ValueError):
+        pool.release([])
+    assert pool.acquire() is a
+
+    stats = pool.stats()
+    assert stats["size"] == 3
+    assert stats["active"] == 3
+    assert stats["created"] == 1
+    assert stats["acquired"] == 4
+    assert stats["released"] == 1
+    assert stats["utilization"] == 1.0
+    assert b is not c
+
+
+def test_sprite_pool():
+    group = ActiveGroup()
+    pool = SpritePool(make_sprite, group, size=4)
+
+    assert len(group.spritedict) == 4
+    assert len(group) == 0
+
+    sprite = pool.acquire(Vector2(10, 20), Vector2(1, 0))
+    assert sprite.active
+    assert group.sprites() == [sprite]
+    assert sprite.rect.topleft == (8, 18)
+    assert sprite.physics_body.velociy == Vector2(1, 0)
+
+    group.update()
+    assert sprite.updates == 1
+
+    pool.release(sprite)
+    assert not sprite.active
+    assert len(group) == 0
+    assert sprite in group.spritedict
+    assert sprite.physics_body.velociy == Vector2()
+
+    group.update()
+    assert sprite.updates == 1
+    assert pool.stats()["peak"] == 1
+
+    with pytest.raises(ValueError):
+        pool.release(sprite)
+    assert pool.stats()["active"] == 0
+
+
+def test_sprite_pool_world():
+    pool = SpritePool(make_sprite, ActiveGroup(), size=1)
+    parked = pool.acquire()
+    world = PhysicsWorld(parked.physics_body)
+    pool.release(parked)
+
+    # the free sprite's body keeps falling while parked
+    for _ in range(60):
+        world.force(Vector2(0, PhysicsBody.GRAVITY), 1 / 60)
+
+    sprite = pool.acquire(Vector2(50, 50))
+    assert sprite is parked
+    assert sprite.physics_body.velociy == Vector2()
+    assert sprite.physics_body.position == Vector2(50, 50)
+
+
+def test_body_pool():
+    pool = ObjectPool(PhysicsBody, size=1, reset=reset_body)
+    body = pool.acquire()
+    body.position = Vector2(3, 4)
+    body.velociy = Vector2(1, 1)
+
+    pool.release(body)
+    assert body.position == Vector2()
+    assert body.velociy == Vector2()
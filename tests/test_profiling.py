@@ -0,0 +1,71 @@
+import time
+
+from pygame import Surface, Vector2
+
+from game_utils.physics import PhysicsBody
+from game_utils.profiling import *
+
+
+def test_frame_profiler():
+    frames = []
+    profiler = FrameProfiler(window=10)
+    profiler.add_listener(frames.append)
+
+    for _ in range(20):
+        lap = time.perf_counter()
+        lap = profiler.lap("update", lap)
+        profiler.lap("events", lap)
+        profiler.end_frame()
+
+    assert len(frames) == 20
+    assert set(frames[0]) == {"update", "events", "frame"}
+    assert len(profiler.samples["update"]) == 10
+
+    p = profiler.percentiles("frame")
+    assert p["p50"] <= p["p95"] <= p["p99"]
+    assert profiler.percentiles("missing") == {}
+
+    rect = profiler.draw_overlay(Surface((400, 200)))
+    assert rect.w > 0 and rect.h > 0
+
+
+def test_allocation_tracker():
+    tracker = AllocationTracker(window=5)
+    body = PhysicsBody(velocity=Vector2(1, 1), friction=0.01)
+    tracker.start()
+    for _ in range(3):
+        # every allocation is a temporary, freed before the frame ends
+        for _ in range(200):
+            body.force(Vector2(0.1, 0), 0.01)
+        report = tracker.end_frame()
+    tracker.stop()
+
+    assert len(tracker.reports) == 3
+    assert report["peak"] > 0
+    force = report["functions"]["physics.PhysicsBody.force"]
+    assert force["calls"] == 200
+    assert force["size"] > 0
+    assert force["count"] > 0
+    assert report["functions"]["physics.PhysicsBody.friction_force"]["size"] > 0
+    assert tracker.summary()["physics.PhysicsBody.force"]["calls"] == 200
+
+
+def test_allocation_tracker_no_allocations():
+    tracker = AllocationTracker()
+    body = PhysicsBody()
+    tracker.start()
+    for _ in range(2):
+        for _ in range(1000):
+            body.world
+            body.index
+        report = tracker.end_frame()
+    tracker.stop()
+
+    # the profile hook's own bookkeeping isn't counted
+    for name in ("physics.PhysicsBody.world", "physics.PhysicsBody.index"):
+        assert report["functions"][name] == {
+            "calls": 1000,
+            "count": 0,
+            "size": 0,
+            "net": 0,
+        }
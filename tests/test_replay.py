@@ -0,0 +1,86 @@
+from pygame import Vector2
+
+from game_utils.controller import Controller, JoystickController
+from game_utils.game import Game
+from game_utils.replay import *
+from game_utils.screen import ScreenSettings
+
+
+class MockController(Controller):
+    def __init__(self):
+        super().__init__(
+            1.0, {"input_id": 0, "action_type": "button", "action_name": "jump"}
+        )
+        self.t = 0
+
+    def direction(self) -> Vector2:
+        return Vector2(self.t, -self.t)
+
+    def action(self, key: str) -> float:
+        return float(self.t % 2)
+
+
+class MockJoystick:
+    def get_instance_id(self):
+        return 300
+
+    def get_button(self, i):
+        return True
+
+
+class MockScreenSettings(ScreenSettings):
+    def __init__(self):
+        super().__init__(width=10, height=10, frames_per_second=30, headless=True)
+
+    def update_screen(self):
+        pass
+
+
+class MockGame(Game):
+    def __init__(self, controller: Controller, **kwargs):
+        super().__init__(MockScreenSettings(), **kwargs)
+        self.controller = controller
+        self.history = []
+
+    def update(self):
+        direction = self.controller.direction()
+        self.history.append((self.dt, direction, self.controller.action("jump")))
+        if isinstance(self.controller, MockController):
+            self.controller.t += 1
+
+
+def test_record_replay(tmp_path):
+    path = str(tmp_path / "session.rec")
+
+    controller = MockController()
+    with InputRecorder(path, controller) as recorder:
+        recorded = MockGame(controller, recorder=recorder)
+        recorded.run(max_ticks=20)
+    assert recorder.frames == 20
+
+    with ReplayController(path) as replay:
+        assert list(replay.actions) == ["jump"]
+        replayed = MockGame(replay, replay=replay)
+        replayed.run()
+
+    assert replay.frame == 20
+    assert replayed.ticks == 21
+    assert replayed.history == recorded.history
+
+
+def test_record_without_direction(tmp_path):
+    path = str(tmp_path / "joystick.rec")
+
+    controller = JoystickController(
+        MockJoystick(),
+        1.0,
+        {"input_id": 0, "action_type": "button", "action_name": "jump"},
+    )
+    with InputRecorder(path, controller) as recorder:
+        recorder.record(0.5)
+    controller.close()
+
+    with ReplayController(path) as replay:
+        assert replay.advance() == 0.5
+        assert replay.direction() == Vector2()
+        assert replay.action("jump") == 1.0
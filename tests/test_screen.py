@@ -0,0 +1,76 @@
+from pygame import Color, Rect, Surface
+
+from game_utils.screen import *
+
+
+class MockScreenSettings(ScreenSettings):
+    def __init__(self):
+        super().__init__(
+            width=100,
+            height=100,
+            bg_color="black",
+            headless=True,
+            dirty_rects=True,
+        )
+        self.rect = Rect(10, 10, 5, 5)
+
+    def update_screen(self):
+        self.mark_dirty(self.screen.fill("white", self.rect))
+
+
+def test_dirty_rects():
+    ss = MockScreenSettings()
+    ss.screen.fill("red")
+
+    ss.clear_screen()
+    assert ss.screen.get_at((50, 50)) == Color("black")
+
+    ss.update_screen()
+    ss.flip()
+    assert ss.screen.get_at((10, 10)) == Color("white")
+
+    ss.rect = Rect(50, 50, 5, 5)
+    ss.screen.fill("red", Rect(80, 80, 5, 5))
+    ss.clear_screen()
+    ss.update_screen()
+    assert ss.screen.get_at((10, 10)) == Color("black")
+    assert ss.screen.get_at((50, 50)) == Color("white")
+    # regions never marked dirty are left alone
+    assert ss.screen.get_at((80, 80)) == Color("red")
+
+
+def test_static_background():
+    ss = MockScreenSettings()
+    calls = []
+    ss.add_static(lambda surface: calls.append(surface.fill("blue", ss.rect)))
+
+    background = ss.background
+    assert ss.background is background
+    assert background.get_at((10, 10)) == Color("blue")
+    assert background.get_at((50, 50)) == Color("black")
+
+    ss.screen.fill("red")
+    ss.draw_background(Rect(0, 0, 20, 20))
+    assert ss.screen.get_at((12, 12)) == Color("blue")
+    assert ss.screen.get_at((30, 30)) == Color("red")
+
+    ss.bg_color = "green"
+    assert ss.background is not background
+    assert ss.background.get_at((50, 50)) == Color("green")
+    assert len(calls) == 2
+
+
+def test_draw_sprites():
+    ss = MockScreenSettings()
+    ss.clear_screen()
+
+    class MockSprite:
+        def __init__(self, x: int):
+            self.image = Surface((5, 5))
+            self.image.fill("white")
+            self.rect = Rect(x, 0, 5, 5)
+
+    ss.draw_sprites([MockSprite(0), MockSprite(20)], [MockSprite(500)])
+
+    assert ss.screen.get_at((22, 2)) == Color("white")
+    assert ss._dirty == [Rect(0, 0, 5, 5), Rect(20, 0, 5, 5)]
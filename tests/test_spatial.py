@@ -0,0 +1,73 @@
+import math
+
+from pygame import Rect, Surface, Vector2
+
+from game_utils.spatial import *
+from game_utils.sprites import GameSprite
+
+
+class MockSprite(GameSprite):
+    def update(self, *args, **kwargs):
+        pass
+
+
+def make_sprite(x: float, y: float) -> MockSprite:
+    sprite = MockSprite(Surface((10, 10)), Vector2(x, y))
+    sprite._update_pos()
+    return sprite
+
+
+def test_spatial_hash():
+    a = make_sprite(10, 10)
+    b = make_sprite(15, 15)
+    c = make_sprite(500, 500)
+
+    grid = SpatialHash(cell_size=32)
+    grid.rebuild([a, b, c])
+
+    assert len(grid) == 3
+    pairs = grid.candidate_pairs()
+    assert len(pairs) == 1
+    assert set(pairs.pop()) == {a, b}
+    assert grid.query(Rect(490, 490, 20, 20)) == {c}
+
+    c._update_pos(Vector2(12, 12))
+    grid.sync([a, c])
+
+    assert b not in grid
+    assert {frozenset(p) for p in grid.candidate_pairs()} == {frozenset((a, c))}
+
+
+def test_spatial_group():
+    sprites = [make_sprite(x * 37 % 500, x * 91 % 500) for x in range(200)]
+    for i, sprite in enumerate(sprites):
+        sprite.id = i
+
+    group = SpatialGroup(*sprites, cell_size=32)
+    assert group.get(7) is sprites[7]
+
+    area = Rect(100, 100, 80, 60)
+    assert set(group.query_rect(area)) == {
+        s for s in sprites if area.colliderect(s.rect)
+    }
+
+    def distance(s):
+        return math.dist((250, 250), s.rect.center)
+
+    assert set(group.query_radius((250, 250), 60)) == {
+        s for s in sprites if distance(s) <= 60
+    }
+    assert [distance(s) for s in group.nearest((250, 250), 5)] == sorted(
+        map(distance, sprites)
+    )[:5]
+
+    # moves are indexed by _update_pos
+    sprites[3]._update_pos(Vector2(251, 251))
+    assert group.nearest((250, 250))[0] is sprites[3]
+    assert sprites[3] in group.query_rect(Rect(245, 245, 10, 10))
+
+    group.remove(sprites[3])
+    assert group.get(3) is None
+    assert sprites[3] not in group.query_rect(Rect(245, 245, 10, 10))
+    assert len(group.nearest((0, 0), 500)) == 199
+    assert group.nearest((250, 250), 0) == []
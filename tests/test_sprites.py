@@ -0,0 +1,91 @@
+import numpy as np
+from pygame import Rect, Surface, Vector2
+
+from game_utils.physics import *
+from game_utils.sprites import *
+
+
+class MockSprite(PhysicsSprite):
+    def update(self, *args, **kwargs):
+        pass
+
+
+def make_sprites(positions, velocities) -> list[MockSprite]:
+    return [
+        MockSprite(
+            Surface((10, 10)),
+            Vector2(p),
+            PhysicsBody(mass=1, velocity=Vector2(v), elasticity=0.5),
+            boundaries=Rect(100, 0, 100, 0),
+        )
+        for p, v in zip(positions, velocities)
+    ]
+
+
+def test_bound_sprites():
+    positions = [(50, 50), (120, 50), (50, -3.3), (101.7, 98.2)]
+    velocities = [(1, 1), (2, 3), (4, -5), (6, 7)]
+
+    expected = make_sprites(positions, velocities)
+    actual = make_sprites(positions, velocities)
+
+    def reflect(body: PhysicsBody, axis: int):
+        def callback():
+            v = body.velociy
+            v[axis] = -v[axis]
+            body.velociy = v * body.elasticity
+
+        return callback
+
+    for sprite in expected:
+        body = sprite.physics_body
+        sprite._update_pos(body.position, reflect(body, 0), reflect(body, 1))
+
+    bounded, hit_x, hit_y = bound_sprites(actual)
+
+    assert bounded == actual
+    assert hit_x.tolist() == [False, True, False, True]
+    assert hit_y.tolist() == [False, False, True, True]
+    for e, a in zip(expected, actual):
+        assert a.position == e.position
+        assert a.rect == e.rect
+        assert a.physics_body.velociy == e.physics_body.velociy
+
+
+def test_clamp_to_bounds_world():
+    world = PhysicsWorld(
+        *(PhysicsBody(mass=1, position=Vector2(x, 50)) for x in (-10, 50, 200))
+    )
+    world.velocities[:] = (3, 0)
+
+    n = len(world)
+    hit_x, hit_y = clamp_to_bounds(
+        world.positions,
+        np.full((n, 2), 10.0),
+        np.tile((100.0, 0.0, 100.0, 0.0), (n, 1)),
+        world.velocities,
+        reflect=False,
+    )
+
+    assert hit_x.tolist() == [True, False, True]
+    assert not hit_y.any()
+    assert world.positions[:, 0].tolist() == [5, 50, 95]
+    assert world.velocities[:, 0].tolist() == [0, 3, 0]
+
+
+def test_update_pos_follows_world():
+    body = PhysicsBody(mass=1, velocity=Vector2(10, 0))
+    sprite = MockSprite(Surface((10, 10)), Vector2(50, 50), body)
+    world = PhysicsWorld(body)
+    held = sprite.position
+
+    world.move(1.0)
+    sprite._update_pos()
+    assert body.position == Vector2(60, 50)
+    assert sprite.position == Vector2(60, 50)
+    assert held is sprite.position
+
+    world.force(Vector2(0, 0), 1.0)
+    sprite._update_pos()
+    assert sprite.position == body.position
+    assert sprite.rect.center == (int(body.position.x), 50)
@@ -0,0 +1,43 @@
+import numpy as np
+from pygame import Vector2
+
+from game_utils.physics import PhysicsWorld
+from game_utils.vector_utils import *
+
+
+def test_random_source():
+    a = RandomSource(seed=7, block_size=8)
+    b = RandomSource(seed=7, block_size=8)
+
+    # batches crossing block boundaries still give the same stream
+    assert np.array_equal(
+        np.concatenate([a.random(5), a.random(5), a.random(20)]), b.random(30)
+    )
+    assert np.all((0 <= b.random(100)) & (b.random(100) < 1))
+    assert a.normal(3, loc=10.0).shape == (3,)
+
+
+def test_get_random_vectors():
+    source = RandomSource(seed=1)
+    vectors = get_random_vectors(1000, 5.0, source=source)
+
+    assert vectors.shape == (1000, 2)
+    assert np.all(np.abs(vectors) <= 5.0)
+    assert np.any(vectors < 0)
+    assert np.all(get_random_vectors(100, non_negative=True, source=source) >= 0)
+
+    set_random_source(RandomSource(seed=3))
+    v = get_random_vector(2.0)
+    set_random_source(RandomSource(seed=3))
+    assert isinstance(v, Vector2)
+    assert get_random_vector(2.0) == v
+    set_random_source(RandomSource())
+
+
+def test_world_seed():
+    def kinetic_frictions(seed: int) -> list[float]:
+        world = PhysicsWorld(seed=seed)
+        return [world.create(friction=0.1).kinetic_friction for _ in range(5)]
+
+    assert kinetic_frictions(42) == kinetic_frictions(42)
+    assert kinetic_frictions(42) != kinetic_frictions(43)